@@ -1,9 +1,14 @@
-from .geolocation import GeolocationClient
-from .geocoding import GeocodingClient
-from .weather import WeatherClient
-from .events import EventsClient
-from .attractions import AttractionsClient
-from .countries import CountriesClient
+import importlib
+
+# Client modules are imported on first access so a run only loads the clients it uses
+_CLIENT_MODULES = {
+    'GeolocationClient': '.geolocation',
+    'GeocodingClient': '.geocoding',
+    'WeatherClient': '.weather',
+    'EventsClient': '.events',
+    'AttractionsClient': '.attractions',
+    'CountriesClient': '.countries'
+}
 
 __all__ = [
     'GeolocationClient',
@@ -12,4 +17,9 @@ __all__ = [
     'EventsClient',
     'AttractionsClient',
     'CountriesClient'
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    if name in _CLIENT_MODULES:
+        return getattr(importlib.import_module(_CLIENT_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,17 @@
+from .geolocation import AsyncGeolocationClient
+from .geocoding import AsyncGeocodingClient
+from .weather import AsyncWeatherClient
+from .events import AsyncEventsClient
+from .attractions import AsyncAttractionsClient
+from .countries import AsyncCountriesClient
+from .session import close_session
+
+__all__ = [
+    'AsyncGeolocationClient',
+    'AsyncGeocodingClient',
+    'AsyncWeatherClient',
+    'AsyncEventsClient',
+    'AsyncAttractionsClient',
+    'AsyncCountriesClient',
+    'close_session'
+]
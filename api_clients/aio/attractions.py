@@ -0,0 +1,44 @@
+import asyncio
+import aiohttp
+from utils.aio_cache import async_cache
+from utils.geo import geohash_key
+from utils.metrics import metrics
+from config import Config
+from ..attractions import AttractionsClient
+from . import session
+
+class AsyncAttractionsClient(AttractionsClient):
+    @async_cache(ttl=86400, stale_ttl=86400, key=geohash_key(Config.ATTRACTIONS_GEOHASH_PRECISION))
+    async def get_attractions(self, lat, lon, radius=5000, limit=5):
+        try:
+            places = await session.get_json(self.BASE_URL, params=self._params(lat, lon, radius, limit),
+                                            provider=self.PROVIDER)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            print(f"Attractions API error: {e}")
+            return []
+
+        # Fetch details concurrently, at most ATTRACTION_DETAIL_WORKERS at a time
+        semaphore = asyncio.Semaphore(Config.ATTRACTION_DETAIL_WORKERS)
+
+        async def details(xid):
+            async with semaphore:
+                return await self._get_place_details(xid)
+
+        return list(await asyncio.gather(*(details(place['xid']) for place in places)))
+
+    async def _get_place_details(self, xid):
+        with metrics.span('attraction_detail'):
+            details = await self._fetch_place_details(xid)
+        if details is None:
+            return self._unknown_place(xid)
+        return details
+
+    @async_cache(ttl=604800)  # Place details rarely change, cache for a week
+    async def _fetch_place_details(self, xid):
+        """Fetch details for a single place, or None on failure (not cached)"""
+        try:
+            return await session.get_json(self.DETAILS_URL.format(xid),
+                                          params={'apikey': Config.OPENTRIPMAP_API_KEY},
+                                          provider=self.PROVIDER)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            return None
@@ -0,0 +1,16 @@
+import asyncio
+import aiohttp
+from utils.aio_cache import async_cache
+from ..countries import CountriesClient
+from . import session
+
+class AsyncCountriesClient(CountriesClient):
+    @async_cache(ttl=86400, stale_ttl=604800)
+    async def get_country_info(self, country_code):
+        try:
+            return self._parse(await session.get_json(
+                f"{self.BASE_URL}/alpha/{country_code}", provider=self.PROVIDER
+            ))
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            print(f"Countries API error: {e}")
+            return None
@@ -0,0 +1,47 @@
+import asyncio
+import aiohttp
+from utils.aio_cache import async_cache
+from config import Config
+from ..events import EventsClient
+from . import session
+
+class AsyncEventsClient(EventsClient):
+    async def get_events(self, location_name, country_code, page=0, size=5):
+        """Get one page of events for a location"""
+        result = await self._fetch_page(location_name, country_code, None, None, page, size)
+        return result['events'] if result else []
+
+    async def iter_events(self, location_name=None, country_code=None, lat=None, lon=None,
+                          radius=None, max_events=None, page_size=None, offset=0):
+        """Async generator counterpart of `EventsClient.iter_events`"""
+        page_size = page_size or Config.EVENTS_PAGE_SIZE
+        geo_point, radius = self._geo_query(lat, lon, radius)
+        limit = self._limit(offset, max_events)
+
+        position = offset
+        while position < limit and not self._too_deep(position, page_size):
+            page, skip = divmod(position, page_size)
+            result = await self._fetch_page(location_name, country_code, geo_point, radius, page, page_size)
+            if not result:
+                return
+            events = result['events'][skip:limit - position + skip]
+            for event in events:
+                yield event
+            position += len(events)
+            if self._last_page(result, page, page_size):
+                return
+
+    @async_cache(ttl=3600, stale_ttl=3600)  # Fresh for 1 hour, served stale for another
+    async def _fetch_page(self, location_name, country_code, geo_point, radius, page, size):
+        """Fetch one page as {'events', 'total_pages'}, or None on failure (not cached)"""
+        try:
+            data = await session.get_json(self.BASE_URL, params=self._params(
+                location_name, country_code, page, size, geo_point, radius
+            ), provider=self.PROVIDER)
+            return self._parse_page(data)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Events API error: {e}")
+            return None
+        except (KeyError, ValueError) as e:
+            print(f"Error parsing events data: {e}")
+            return None
@@ -0,0 +1,26 @@
+from utils.aio_cache import async_cache
+from config import Config
+from ..geocoding import GeocodingClient
+from ..gazetteer import normalize_query
+from . import session
+
+class AsyncGeocodingClient(GeocodingClient):
+    async def get_coordinates(self, location_query):
+        location = self._lookup_offline(location_query)
+        if location:
+            return location
+        return await self._search(location_query)
+
+    @async_cache(ttl=Config.GEOCODING_CACHE_TTL, key=normalize_query)
+    async def _search(self, location_query):
+        try:
+            results = await session.get_json(
+                self.BASE_URL,
+                params=self._params(location_query),
+                headers=self.HEADERS,
+                provider=self.PROVIDER
+            )
+            return self._parse(results)
+        except Exception as e:
+            print(f"Geocoding error: {e}")
+            return None
@@ -0,0 +1,12 @@
+from ..geolocation import GeolocationClient
+from . import session
+
+class AsyncGeolocationClient(GeolocationClient):
+    async def get_location(self, ip_address=None):
+        try:
+            return await session.get_json(
+                self.BASE_URL + (ip_address or ""), params=self.PARAMS, provider=self.PROVIDER
+            )
+        except Exception as e:
+            print(f"Geolocation error: {e}")
+            return None
@@ -0,0 +1,65 @@
+import asyncio
+import weakref
+import aiohttp
+from config import Config
+from utils.metrics import metrics
+from .. import scheduler
+from ..session import provider_url
+
+_sessions = weakref.WeakKeyDictionary()  # event loop -> aiohttp.ClientSession
+
+def get_session():
+    """Return the aiohttp.ClientSession shared by async clients on the running loop.
+
+    Its connector keeps keep-alive connections per host, sized like the
+    synchronous pool in api_clients.session.
+    """
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=Config.HTTP_POOL_CONNECTIONS * Config.HTTP_POOL_MAXSIZE,
+                limit_per_host=Config.HTTP_POOL_MAXSIZE
+            ),
+            timeout=aiohttp.ClientTimeout(
+                sock_connect=Config.HTTP_CONNECT_TIMEOUT,
+                sock_read=Config.HTTP_READ_TIMEOUT
+            )
+        )
+        _sessions[loop] = session
+    return session
+
+async def get_json(url, params=None, headers=None, provider=None):
+    """GET through the shared session and decode the JSON body.
+
+    With `provider`, waits for that provider's rate limit first and honours
+    PROVIDER_URL_OVERRIDE and record mode like the synchronous session. Raises
+    aiohttp.ClientError for transport errors and error statuses.
+    """
+    await scheduler.throttle_async(provider)
+    if params is not None:
+        params = {k: str(v) for k, v in params.items()}
+    with metrics.span('upstream', provider=provider or 'other'):
+        try:
+            async with get_session().get(provider_url(url, provider), params=params, headers=headers) as response:
+                if Config.RECORD_DIR and provider:
+                    from utils import replay
+                    replay.record(provider, url, params, response.status, await response.text())
+                response.raise_for_status()
+                return await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if isinstance(e, aiohttp.ClientResponseError):
+                kind = 'http'
+            elif isinstance(e, asyncio.TimeoutError):
+                kind = 'timeout'
+            else:
+                kind = 'connection'
+            metrics.inc('upstream_errors', provider=provider or 'other', kind=kind)
+            raise
+
+async def close_session():
+    """Close the running loop's session; call before the loop shuts down"""
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
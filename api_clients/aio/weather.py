@@ -0,0 +1,16 @@
+from utils.aio_cache import async_cache
+from utils.geo import geohash_key
+from config import Config
+from ..weather import WeatherClient
+from . import session
+
+class AsyncWeatherClient(WeatherClient):
+    @async_cache(ttl=Config.WEATHER_CACHE_TTL, key=geohash_key(Config.WEATHER_GEOHASH_PRECISION))
+    async def get_weather(self, lat, lon):
+        try:
+            return self._parse(await session.get_json(
+                self.BASE_URL, params=self._params(lat, lon), provider=self.PROVIDER
+            ))
+        except Exception as e:
+            print(f"Weather API error: {e}")
+            return None
@@ -1,35 +1,73 @@
-import requests
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from utils.cache import cache
+from utils.geo import geohash_key
+from utils.metrics import metrics
+from . import session
 from config import Config
 
 class AttractionsClient:
     BASE_URL = "https://api.opentripmap.com/0.1/en/places/radius"
+    PROVIDER = "opentripmap"
     DETAILS_URL = "https://api.opentripmap.com/0.1/en/places/xid/{}"
     
-    @cache(ttl=86400)
-    def get_attractions(self, lat, lon, radius=5000):
-        params = {
-            'apikey': Config.OPENTRIPMAP_API_KEY,
-            'radius': radius,
-            'lon': lon,
-            'lat': lat,
-            'format': 'json',
-            'limit': 5
-        }
+    @cache(ttl=86400, stale_ttl=86400, key=geohash_key(Config.ATTRACTIONS_GEOHASH_PRECISION))
+    def get_attractions(self, lat, lon, radius=5000, limit=5):
         try:
-            response = requests.get(self.BASE_URL, params=params)
+            response = session.get(self.BASE_URL, params=self._params(lat, lon, radius, limit),
+                                   provider=self.PROVIDER)
             response.raise_for_status()
             places = response.json()
-            return [self._get_place_details(place['xid']) for place in places]
-        except requests.RequestException as e:
+        except session.RequestException as e:
             print(f"Attractions API error: {e}")
             return []
+
+        xids = [place['xid'] for place in places]
+        if not xids:
+            return []
+        if metrics.profiler is not None:
+            # cProfile only sees the thread that enabled it, so profile the details inline
+            return [self._get_place_details(xid) for xid in xids]
+
+        # Fetch details concurrently; map() keeps the radius query's ordering. Workers
+        # inherit this thread's context (fetch deadline, background refresh priority).
+        context = contextvars.copy_context()
+        workers = min(Config.ATTRACTION_DETAIL_WORKERS, len(xids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda xid: context.copy().run(self._get_place_details, xid), xids
+            ))
     
     def _get_place_details(self, xid):
+        with metrics.span('attraction_detail'):
+            details = self._fetch_place_details(xid)
+        if details is None:
+            return self._unknown_place(xid)
+        return details
+
+    @cache(ttl=604800)  # Place details rarely change, cache for a week
+    def _fetch_place_details(self, xid):
+        """Fetch details for a single place, or None on failure (not cached)"""
         try:
-            response = requests.get(self.DETAILS_URL.format(xid), 
-                                  params={'apikey': Config.OPENTRIPMAP_API_KEY})
+            response = session.get(self.DETAILS_URL.format(xid), 
+                                  params={'apikey': Config.OPENTRIPMAP_API_KEY},
+                                  provider=self.PROVIDER)
             response.raise_for_status()
             return response.json()
-        except requests.RequestException:
-            return {'name': 'Unknown attraction', 'xid': xid}
\ No newline at end of file
+        except session.RequestException:
+            return None
+
+    @staticmethod
+    def _params(lat, lon, radius, limit):
+        return {
+            'apikey': Config.OPENTRIPMAP_API_KEY,
+            'radius': radius,
+            'lon': lon,
+            'lat': lat,
+            'format': 'json',
+            'limit': limit
+        }
+
+    @staticmethod
+    def _unknown_place(xid):
+        return {'name': 'Unknown attraction', 'xid': xid}
@@ -1,23 +1,28 @@
-import requests
 from utils.cache import cache
+from . import session
 
 class CountriesClient:
     BASE_URL = "https://restcountries.com/v3.1"
+    PROVIDER = "restcountries"
     
-    @cache(ttl=86400)
+    @cache(ttl=86400, stale_ttl=604800)
     def get_country_info(self, country_code):
         try:
-            response = requests.get(f"{self.BASE_URL}/alpha/{country_code}")
+            response = session.get(f"{self.BASE_URL}/alpha/{country_code}", provider=self.PROVIDER)
             response.raise_for_status()
-            data = response.json()[0]
-            return {
-                'name': data['name'],
-                'capital': data.get('capital', ['Unknown']),
-                'population': data['population'],
-                'languages': data.get('languages', {}),
-                'currencies': data.get('currencies', {}),
-                'flags': data['flags']
-            }
-        except requests.RequestException as e:
+            return self._parse(response.json())
+        except session.RequestException as e:
             print(f"Countries API error: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    @staticmethod
+    def _parse(data):
+        data = data[0]
+        return {
+            'name': data['name'],
+            'capital': data.get('capital', ['Unknown']),
+            'population': data['population'],
+            'languages': data.get('languages', {}),
+            'currencies': data.get('currencies', {}),
+            'flags': data['flags']
+        }
@@ -1,44 +1,119 @@
-import requests
 from utils.cache import cache
+from utils.geo import geohash
+from . import session
 from config import Config
 
 class EventsClient:
     BASE_URL = "https://app.ticketmaster.com/discovery/v2/events.json"
+    PROVIDER = "ticketmaster"
     
-    @cache(ttl=3600)  # Cache for 1 hour
-    def get_events(self, location_name, country_code):
-        """Get events for a location"""
-        params = {
-            "apikey": Config.TICKETMASTER_API_KEY,
-            "city": location_name,
-            "countryCode": country_code,
-            "size": 5
-        }
+    def get_events(self, location_name, country_code, page=0, size=5):
+        """Get one page of events for a location"""
+        result = self._fetch_page(location_name, country_code, None, None, page, size)
+        return result['events'] if result else []
+
+    def iter_events(self, location_name=None, country_code=None, lat=None, lon=None,
+                    radius=None, max_events=None, page_size=None, offset=0):
+        """Yield events for a city, or within `radius` km of lat/lon, one page at a time.
+
+        Pages are fetched (and cached) only as the caller consumes them, so the
+        first events are usable before later pages load and memory stays at one
+        page. Stops after `max_events`, at the last page, or at Ticketmaster's
+        deep paging limit (Config.EVENTS_MAX_RESULTS).
+        """
+        page_size = page_size or Config.EVENTS_PAGE_SIZE
+        geo_point, radius = self._geo_query(lat, lon, radius)
+        limit = self._limit(offset, max_events)
+
+        position = offset
+        while position < limit and not self._too_deep(position, page_size):
+            page, skip = divmod(position, page_size)
+            result = self._fetch_page(location_name, country_code, geo_point, radius, page, page_size)
+            if not result:
+                return
+            events = result['events'][skip:limit - position + skip]
+            yield from events
+            position += len(events)
+            if self._last_page(result, page, page_size):
+                return
+
+    @cache(ttl=3600, stale_ttl=3600)  # Fresh for 1 hour, served stale for another
+    def _fetch_page(self, location_name, country_code, geo_point, radius, page, size):
+        """Fetch one page as {'events', 'total_pages'}, or None on failure (not cached)"""
         try:
-            response = requests.get(self.BASE_URL, params=params, timeout=10)
+            response = session.get(self.BASE_URL, params=self._params(
+                location_name, country_code, page, size, geo_point, radius
+            ), provider=self.PROVIDER)
             response.raise_for_status()
-            data = response.json()
-            
-            # Handle empty or invalid responses
-            if not data.get('_embedded', {}).get('events'):
-                return []
-                
-            events = []
-            for event in data['_embedded']['events']:
-                # Safely extract venue name
-                venue = event.get('_embedded', {}).get('venues', [{}])[0].get('name', 'Unknown venue')
-                
-                events.append({
-                    'title': event.get('name', 'Unknown event'),
-                    'date': event.get('dates', {}).get('start', {}).get('localDate', 'Date not available'),
-                    'venue': venue,
-                    'url': event.get('url', '#')
-                })
-            return events
-            
-        except requests.RequestException as e:
+            return self._parse_page(response.json())
+        except session.RequestException as e:
             print(f"Events API error: {e}")
-            return []
+            return None
         except (KeyError, ValueError) as e:
             print(f"Error parsing events data: {e}")
-            return []
\ No newline at end of file
+            return None
+
+    @staticmethod
+    def _geo_query(lat, lon, radius):
+        """Return the (geoPoint, radius) for a lat/lon query, or (None, None) for city queries"""
+        if lat is None or lon is None:
+            return None, None
+        # Geohash cells let nearby coordinates share cached pages
+        return geohash(lat, lon, Config.EVENTS_GEOHASH_PRECISION), radius or Config.EVENTS_RADIUS_KM
+
+    @staticmethod
+    def _limit(offset, max_events):
+        if max_events is None:
+            return Config.EVENTS_MAX_RESULTS
+        return min(offset + max_events, Config.EVENTS_MAX_RESULTS)
+
+    @staticmethod
+    def _too_deep(position, page_size):
+        # Ticketmaster rejects any page reaching past size * page = EVENTS_MAX_RESULTS
+        return (position // page_size + 1) * page_size > Config.EVENTS_MAX_RESULTS
+
+    @staticmethod
+    def _last_page(result, page, page_size):
+        return page + 1 >= result['total_pages'] or len(result['events']) < page_size
+
+    @staticmethod
+    def _params(location_name, country_code, page=0, size=5, geo_point=None, radius=None):
+        params = {
+            "apikey": Config.TICKETMASTER_API_KEY,
+            "page": page,
+            "size": size
+        }
+        if geo_point:
+            params.update({"geoPoint": geo_point, "radius": radius, "unit": "km"})
+        else:
+            params.update({"city": location_name, "countryCode": country_code})
+        return params
+
+    @classmethod
+    def _parse_page(cls, data):
+        return {
+            'events': cls._parse(data),
+            'total_pages': data.get('page', {}).get('totalPages', 0)
+        }
+
+    @staticmethod
+    def _parse(data):
+        # Handle empty or invalid responses
+        if not data.get('_embedded', {}).get('events'):
+            return []
+            
+        events = []
+        for event in data['_embedded']['events']:
+            # Safely extract venue name
+            venue = (event.get('_embedded', {}).get('venues') or [{}])[0].get('name', 'Unknown venue')
+            # Segment such as "Music" or "Sports", used to rank suggestions
+            category = ((event.get('classifications') or [{}])[0].get('segment') or {}).get('name')
+            
+            events.append({
+                'title': event.get('name', 'Unknown event'),
+                'date': event.get('dates', {}).get('start', {}).get('localDate', 'Date not available'),
+                'venue': venue,
+                'category': category,
+                'url': event.get('url', '#')
+            })
+        return events
@@ -0,0 +1,101 @@
+import csv
+import bisect
+import threading
+import unicodedata
+from config import Config
+
+def normalize_query(query):
+    """Normalize a place query for matching and cache keys.
+
+    Lowercases, strips accents and collapses whitespace, so "São  Paulo"
+    and "sao paulo" are treated as the same query.
+    """
+    decomposed = unicodedata.normalize('NFKD', query)
+    stripped = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    parts = [' '.join(part.split()) for part in stripped.lower().split(',')]
+    return ', '.join(part for part in parts if part)
+
+class Gazetteer:
+    """Offline city index for resolving common place names without a network call.
+
+    Loads a CSV with `name,country_code,country,lat,lon,population` columns.
+    Names are kept in a sorted index for exact and prefix lookups; when
+    several cities match the most populous one wins unless the query names
+    a country ("Paris, US" or "London, Canada"). Queries of at least
+    Config.GAZETTEER_MIN_PREFIX characters without an exact match resolve to
+    the most populous city whose name starts with them ("San Franc").
+    """
+
+    def __init__(self, path):
+        self._keys = []
+        self._entries = []
+
+        with open(path, newline='', encoding='utf-8') as f:
+            # Rows themselves are never compared: equal names and populations keep file order
+            rows = sorted(
+                ((normalize_query(row['name']), -int(row['population'] or 0), row)
+                 for row in csv.DictReader(f)),
+                key=lambda item: item[:2]
+            )
+        for key, population, row in rows:
+            self._keys.append(key)
+            self._entries.append({
+                'city': row['name'],
+                'lat': float(row['lat']),
+                'lon': float(row['lon']),
+                'countryCode': row['country_code'],
+                '_country': normalize_query(row['country']),
+                '_population': -population
+            })
+
+    def lookup(self, query):
+        """Return location data for an exact or, failing that, a prefix match, or None"""
+        name, _, country = normalize_query(query).partition(', ')
+        start = bisect.bisect_left(self._keys, name)
+        end = bisect.bisect_right(self._keys, name, lo=start)
+        for entry in self._entries[start:end]:
+            if self._in_country(entry, country):
+                return self._public(entry)
+
+        if len(name) < Config.GAZETTEER_MIN_PREFIX:
+            return None
+        matches = [entry for entry in self._prefix_entries(name) if self._in_country(entry, country)]
+        if not matches:
+            return None
+        return self._public(max(matches, key=lambda entry: entry['_population']))
+
+    def complete(self, prefix, limit=10):
+        """Return up to `limit` cities whose name starts with `prefix`, most populous first"""
+        matches = sorted(self._prefix_entries(normalize_query(prefix)),
+                         key=lambda entry: -entry['_population'])
+        return [self._public(entry) for entry in matches[:limit]]
+
+    def _prefix_entries(self, prefix):
+        start = bisect.bisect_left(self._keys, prefix)
+        for key, entry in zip(self._keys[start:], self._entries[start:]):
+            if not key.startswith(prefix):
+                break
+            yield entry
+
+    @staticmethod
+    def _in_country(entry, country):
+        return not country or country in (entry['countryCode'].lower(), entry['_country'])
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _public(entry):
+        return {k: v for k, v in entry.items() if not k.startswith('_')}
+
+_gazetteer = None
+_gazetteer_lock = threading.Lock()
+
+def get_gazetteer():
+    """Return the gazetteer for Config.GAZETTEER_FILE, loading it on first use"""
+    global _gazetteer
+    if _gazetteer is None:
+        with _gazetteer_lock:
+            if _gazetteer is None:
+                _gazetteer = Gazetteer(Config.GAZETTEER_FILE)
+    return _gazetteer
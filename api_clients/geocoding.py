@@ -1,35 +1,62 @@
-import requests
+from utils.cache import cache
 from config import Config
+from . import session
+from .gazetteer import get_gazetteer, normalize_query
 
 class GeocodingClient:
     BASE_URL = "https://nominatim.openstreetmap.org/search"
+    PROVIDER = "nominatim"
+    HEADERS = {
+        'User-Agent': 'CulturalWeatherExplorer/1.0 (contact@example.com)'
+    }
     
     def get_coordinates(self, location_query):
-        params = {
-            'q': location_query,
-            'format': 'json',
-            'limit': 1
-        }
-        headers = {
-            'User-Agent': 'CulturalWeatherExplorer/1.0 (contact@example.com)'
-        }
+        location = self._lookup_offline(location_query)
+        if location:
+            return location
+        return self._search(location_query)
+
+    @staticmethod
+    def _lookup_offline(location_query):
+        # Common city names resolve from the local gazetteer without a network call
+        if not Config.GAZETTEER_ENABLED:
+            return None
+        try:
+            return get_gazetteer().lookup(location_query)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Gazetteer error: {e}")
+            return None
+
+    @cache(ttl=Config.GEOCODING_CACHE_TTL, key=normalize_query)
+    def _search(self, location_query):
         try:
-            response = requests.get(
+            response = session.get(
                 self.BASE_URL,
-                params=params,
-                headers=headers,
-                timeout=5
+                params=self._params(location_query),
+                headers=self.HEADERS,
+                provider=self.PROVIDER
             )
             response.raise_for_status()
-            results = response.json()
-            if results:
-                return {
-                    'city': results[0].get('display_name', '').split(',')[0],
-                    'lat': float(results[0]['lat']),
-                    'lon': float(results[0]['lon']),
-                    'countryCode': results[0].get('address', {}).get('country_code', 'us')
-                }
-            return None
+            return self._parse(response.json())
         except Exception as e:
             print(f"Geocoding error: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    @staticmethod
+    def _params(location_query):
+        return {
+            'q': location_query,
+            'format': 'json',
+            'limit': 1
+        }
+
+    @staticmethod
+    def _parse(results):
+        if results:
+            return {
+                'city': results[0].get('display_name', '').split(',')[0],
+                'lat': float(results[0]['lat']),
+                'lon': float(results[0]['lon']),
+                'countryCode': results[0].get('address', {}).get('country_code', 'us')
+            }
+        return None
@@ -1,18 +1,20 @@
-import requests
 from config import Config
+from . import session
 
 class GeolocationClient:
     BASE_URL = "http://ip-api.com/json/"
+    PROVIDER = "ip-api"
+    PARAMS = {"fields": "city,country,countryCode,lat,lon"}
     
     def get_location(self, ip_address=None):
         try:
-            response = requests.get(
+            response = session.get(
                 self.BASE_URL + (ip_address or ""),
-                params={"fields": "city,country,countryCode,lat,lon"},
-                timeout=5
+                params=self.PARAMS,
+                provider=self.PROVIDER
             )
             response.raise_for_status()
             return response.json()
         except Exception as e:
             print(f"Geolocation error: {e}")
-            return None
\ No newline at end of file
+            return None
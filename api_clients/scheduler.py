@@ -0,0 +1,161 @@
+import heapq
+import itertools
+import threading
+import time
+from utils.cache import in_background_refresh
+from utils.fanout import current_deadline
+from config import Config
+
+FOREGROUND = 0
+BACKGROUND = 1  # Stale-entry refreshes; served only when no foreground request waits
+
+class RateLimiter:
+    """Token bucket for one provider with a fair queue of waiting requests.
+
+    Requests wait in a heap ordered by priority, then arrival, and a
+    dispatcher thread releases the head whenever a token is available, so
+    callers are served strictly in turn instead of racing for tokens. Cache
+    hits return before reaching the limiter and never queue behind upstream
+    requests. Works for threads (`acquire`) and asyncio tasks
+    (`acquire_async`) sharing the same bucket.
+    """
+
+    def __init__(self, name, rate, burst=1):
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._queue = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._dispatcher = None
+        self.granted = 0
+        self.waited = 0.0
+
+    def acquire(self, priority=FOREGROUND):
+        """Block until this request may be sent"""
+        event = threading.Event()
+        self._enqueue(priority, event.set, lambda: False)
+        event.wait()
+
+    async def acquire_async(self, priority=FOREGROUND):
+        """Wait on the running loop until this request may be sent"""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def grant():
+            try:
+                loop.call_soon_threadsafe(lambda: future.done() or future.set_result(None))
+            except RuntimeError:
+                pass  # Loop already closed
+
+        self._enqueue(priority, grant, future.cancelled)
+        await future
+
+    @property
+    def queue_depth(self):
+        """Number of requests currently waiting for a token"""
+        with self._condition:
+            return len(self._queue)
+
+    def stats(self):
+        with self._condition:
+            return {
+                'rate': self.rate,
+                'burst': self.burst,
+                'queue_depth': len(self._queue),
+                'granted': self.granted,
+                'waited_seconds': round(self.waited, 3)
+            }
+
+    def _enqueue(self, priority, grant, cancelled):
+        with self._condition:
+            heapq.heappush(self._queue, (priority, next(self._counter), time.monotonic(), grant, cancelled))
+            if self._dispatcher is None:
+                self._dispatcher = threading.Thread(
+                    target=self._dispatch, name=f"ratelimit-{self.name}", daemon=True
+                )
+                self._dispatcher.start()
+            self._condition.notify()
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _dispatch(self):
+        while True:
+            with self._condition:
+                while not self._queue:
+                    self._condition.wait()
+
+                # Waiters that gave up (cancelled tasks) don't use up a token
+                if self._queue[0][4]():
+                    heapq.heappop(self._queue)
+                    continue
+
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens < 1:
+                    self._condition.wait((1 - self._tokens) / self.rate)
+                    continue
+
+                self._tokens -= 1
+                _, _, queued_at, grant, _ = heapq.heappop(self._queue)
+                self.granted += 1
+                self.waited += now - queued_at
+            grant()
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+def get_limiter(provider):
+    """Return the shared RateLimiter for `provider`, or None if it is unlimited.
+
+    Limits come from Config.RATE_LIMITS as (requests per second, burst).
+    """
+    with _limiters_lock:
+        if provider not in _limiters:
+            limit = Config.RATE_LIMITS.get(provider)
+            _limiters[provider] = RateLimiter(provider, *limit) if limit else None
+        return _limiters[provider]
+
+def current_priority():
+    return BACKGROUND if in_background_refresh.get() else FOREGROUND
+
+def throttle(provider):
+    """Wait for `provider`'s rate limit before sending a request from this thread.
+
+    The wait is excluded from the caller's fetch timeout (utils.fanout.Deadline).
+    """
+    limiter = provider and get_limiter(provider)
+    if limiter:
+        deadline = current_deadline.get()
+        if deadline:
+            deadline.pause()
+        try:
+            limiter.acquire(current_priority())
+        finally:
+            if deadline:
+                deadline.resume()
+
+async def throttle_async(provider):
+    """Wait for `provider`'s rate limit before sending a request from this task"""
+    limiter = provider and get_limiter(provider)
+    if limiter:
+        deadline = current_deadline.get()
+        if deadline:
+            deadline.pause()
+        try:
+            await limiter.acquire_async(current_priority())
+        finally:
+            if deadline:
+                deadline.resume()
+
+def stats():
+    """Queue depth and throughput counters of every limiter used so far"""
+    with _limiters_lock:
+        limiters = [limiter for limiter in _limiters.values() if limiter]
+    return {limiter.name: limiter.stats() for limiter in limiters}
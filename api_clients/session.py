@@ -0,0 +1,69 @@
+import threading
+from urllib.parse import urlsplit
+from config import Config
+from utils.metrics import metrics
+from . import scheduler
+
+_session = None
+_session_lock = threading.Lock()
+
+def get_session():
+    """Return the process-wide requests.Session shared by all API clients.
+
+    The session keeps a keep-alive connection pool per host, so repeat
+    lookups against the same provider skip the TCP and TLS handshakes.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                adapter = HTTPAdapter(
+                    pool_connections=Config.HTTP_POOL_CONNECTIONS,
+                    pool_maxsize=Config.HTTP_POOL_MAXSIZE
+                )
+                session = requests.Session()
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _session = session
+    return _session
+
+def provider_url(url, provider):
+    """Rewrite a provider URL to <PROVIDER_URL_OVERRIDE>/<provider><path> when an override is set"""
+    if not (Config.PROVIDER_URL_OVERRIDE and provider):
+        return url
+    return f"{Config.PROVIDER_URL_OVERRIDE.rstrip('/')}/{provider}{urlsplit(url).path}"
+
+def get(url, timeout=None, provider=None, **kwargs):
+    """GET through the shared session with the configured connect/read timeouts.
+
+    With `provider`, waits for that provider's rate limit (see api_clients.scheduler)
+    first, honours PROVIDER_URL_OVERRIDE and, in record mode (RECORD_DIR), saves
+    the response as a replay fixture.
+    """
+    if timeout is None:
+        timeout = (Config.HTTP_CONNECT_TIMEOUT, Config.HTTP_READ_TIMEOUT)
+    scheduler.throttle(provider)
+    with metrics.span('upstream', provider=provider or 'other'):
+        try:
+            response = get_session().get(provider_url(url, provider), timeout=timeout, **kwargs)
+        except Exception as e:
+            import requests
+            kind = 'timeout' if isinstance(e, requests.Timeout) else 'connection'
+            metrics.inc('upstream_errors', provider=provider or 'other', kind=kind)
+            raise
+    if response.status_code >= 400:
+        metrics.inc('upstream_errors', provider=provider or 'other', kind='http')
+    if Config.RECORD_DIR and provider:
+        from utils import replay
+        replay.record(provider, url, kwargs.get('params'), response.status_code, response.text)
+    return response
+
+def __getattr__(name):
+    # requests is imported on first use, so runs served entirely from cache never load it
+    if name == 'RequestException':
+        import requests
+        return requests.RequestException
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
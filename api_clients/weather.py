@@ -1,31 +1,39 @@
-import requests
+from utils.cache import cache
+from utils.geo import geohash_key
 from config import Config
+from . import session
 
 class WeatherClient:
     BASE_URL = "https://api.openweathermap.org/data/2.5/weather"
+    PROVIDER = "openweather"
     
+    @cache(ttl=Config.WEATHER_CACHE_TTL, key=geohash_key(Config.WEATHER_GEOHASH_PRECISION))
     def get_weather(self, lat, lon):
         try:
-            response = requests.get(
-                self.BASE_URL,
-                params={
-                    'lat': lat,
-                    'lon': lon,
-                    'appid': Config.OPENWEATHER_API_KEY,
-                    'units': 'metric'
-                },
-                timeout=5
-            )
+            response = session.get(self.BASE_URL, params=self._params(lat, lon), provider=self.PROVIDER)
             response.raise_for_status()
-            data = response.json()
-            return {
-                'temp': data['main']['temp'],
-                'conditions': data['weather'][0]['main'],
-                'description': data['weather'][0]['description'],
-                'humidity': data['main']['humidity'],
-                'wind_speed': data['wind']['speed'],
-                'icon': data['weather'][0]['icon']
-            }
+            return self._parse(response.json())
         except Exception as e:
             print(f"Weather API error: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    @staticmethod
+    def _params(lat, lon):
+        return {
+            'lat': lat,
+            'lon': lon,
+            'appid': Config.OPENWEATHER_API_KEY,
+            'units': 'metric'
+        }
+
+    @staticmethod
+    def _parse(data):
+        return {
+            'temp': data['main']['temp'],
+            'conditions': data['weather'][0]['main'],
+            'condition_id': data['weather'][0]['id'],
+            'description': data['weather'][0]['description'],
+            'humidity': data['main']['humidity'],
+            'wind_speed': data['wind']['speed'],
+            'icon': data['weather'][0]['icon']
+        }
@@ -0,0 +1,118 @@
+import sys
+import json
+import asyncio
+import contextlib
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from pipeline import resolve_location, explore, resolve_location_async, explore_async
+
+def read_queries(lines):
+    """Yield location queries from input lines, skipping blanks and # comments"""
+    for line in lines:
+        query = line.strip()
+        if query and not query.startswith('#'):
+            yield query
+
+def explore_query(clients, query):
+    """Explore a single query, returning a JSON-serializable record"""
+    try:
+        location_data = resolve_location(clients, query)
+        if not location_data:
+            return {'query': query, 'error': 'Could not determine location'}
+        return {'query': query, **explore(clients, location_data)}
+    except Exception as e:
+        return {'query': query, 'error': f"{type(e).__name__}: {e}"}
+
+def run_batch(clients, lines, out, concurrency):
+    """Stream queries through the pipeline and write one JSON line per location.
+
+    At most `concurrency` locations are in flight at once and records are
+    written as soon as each finishes, so memory stays flat however long the
+    input is. Returns the number of records that carry an error.
+    """
+    failures = 0
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="batch") as executor:
+        pending = set()
+        queries = read_queries(lines)
+        exhausted = False
+
+        while pending or not exhausted:
+            while not exhausted and len(pending) < concurrency:
+                query = next(queries, None)
+                if query is None:
+                    exhausted = True
+                else:
+                    pending.add(executor.submit(explore_query, clients, query))
+
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                record = future.result()
+                failures += 'error' in record
+                out.write(json.dumps(record, ensure_ascii=False) + '\n')
+                out.flush()
+
+    return failures
+
+async def explore_query_async(clients, query):
+    try:
+        location_data = await resolve_location_async(clients, query)
+        if not location_data:
+            return {'query': query, 'error': 'Could not determine location'}
+        return {'query': query, **await explore_async(clients, location_data)}
+    except Exception as e:
+        return {'query': query, 'error': f"{type(e).__name__}: {e}"}
+
+async def run_batch_async(clients, lines, out, concurrency):
+    """Event-loop counterpart of `run_batch`: one task per in-flight location, no threads"""
+    failures = 0
+    pending = set()
+    queries = read_queries(lines)
+    exhausted = False
+
+    while pending or not exhausted:
+        while not exhausted and len(pending) < concurrency:
+            query = next(queries, None)
+            if query is None:
+                exhausted = True
+            else:
+                pending.add(asyncio.ensure_future(explore_query_async(clients, query)))
+
+        if not pending:
+            break
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            record = task.result()
+            failures += 'error' in record
+            out.write(json.dumps(record, ensure_ascii=False) + '\n')
+            out.flush()
+
+    return failures
+
+def run_batch_file(clients, path, output_path, concurrency, use_async=False):
+    """Run batch mode over a file of queries ('-' for stdin) into a JSONL file ('-' for stdout).
+
+    With `use_async`, `clients` is ignored and the batch runs on one event loop.
+    """
+    source = sys.stdin if path == '-' else open(path, encoding='utf-8')
+    out = sys.stdout if output_path == '-' else open(output_path, 'w', encoding='utf-8')
+    try:
+        # Keep provider diagnostics off stdout so the JSONL stream stays parseable
+        with contextlib.redirect_stdout(sys.stderr):
+            if use_async:
+                return asyncio.run(_run_batch_async_main(source, out, concurrency))
+            return run_batch(clients, source, out, concurrency)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+
+async def _run_batch_async_main(source, out, concurrency):
+    from pipeline import AsyncClients
+
+    clients = AsyncClients()
+    try:
+        return await run_batch_async(clients, source, out, concurrency)
+    finally:
+        await clients.close()
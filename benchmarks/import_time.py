@@ -0,0 +1,108 @@
+"""Track import-time cost of the console startup path with `python -X importtime`.
+
+Usage:
+    python benchmarks/import_time.py [--repeat 5] [--budget-ms 80] [--json results.json]
+
+Each scenario is imported in a fresh interpreter; the reported cost excludes
+modules the interpreter loads on its own (`python -c pass`). The run fails
+if the GUI or asyncio stacks are imported, or if a scenario exceeds the budget.
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = {
+    # Interpreting main.py up to argument parsing
+    'startup': "import main",
+    # Everything a console lookup loads before touching the network
+    'console': (
+        "import main, pipeline, output.console_output, "
+        "api_clients.geocoding, api_clients.weather, api_clients.events, "
+        "api_clients.attractions, api_clients.countries"
+    ),
+}
+
+# Modules that console mode must never import
+FORBIDDEN = ('tkinter', 'PIL', 'aiohttp', 'asyncio')
+
+def parse_importtime(stderr):
+    """Return [(depth, name, self_us, cumulative_us)] from -X importtime output"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((depth, name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+def run_importtime(code):
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=REPO_ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Import failed for {code!r}:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+def measure(code, interpreter_modules, repeat):
+    totals = []
+    for _ in range(repeat):
+        rows = run_importtime(code)
+        totals.append(sum(
+            cumulative for depth, name, _, cumulative in rows
+            if depth == 0 and name not in interpreter_modules
+        ))
+
+    modules = [row for row in rows if row[1] not in interpreter_modules]
+    slowest = sorted(modules, key=lambda row: row[2], reverse=True)[:10]
+    return {
+        'median_ms': statistics.median(totals) / 1000,
+        'min_ms': min(totals) / 1000,
+        'modules': len(modules),
+        'forbidden': sorted({
+            name for _, name, _, _ in modules
+            if name.split('.')[0] in FORBIDDEN
+        }),
+        'slowest_self_ms': {name: self_us / 1000 for _, name, self_us, _ in slowest},
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per scenario")
+    parser.add_argument("--budget-ms", type=float, help="Fail if a scenario's median exceeds this")
+    parser.add_argument("--json", metavar="PATH", help="Write results as JSON")
+    args = parser.parse_args(argv)
+
+    interpreter_modules = {name for _, name, _, _ in run_importtime("pass")}
+    results = {
+        name: measure(code, interpreter_modules, max(1, args.repeat))
+        for name, code in SCENARIOS.items()
+    }
+
+    failed = False
+    for name, result in results.items():
+        print(f"{name}: {result['median_ms']:.1f} ms median ({result['min_ms']:.1f} ms min), "
+              f"{result['modules']} modules")
+        for module, ms in result['slowest_self_ms'].items():
+            print(f"    {ms:7.2f} ms  {module}")
+        if result['forbidden']:
+            failed = True
+            print(f"  FAIL: imports {', '.join(result['forbidden'])}")
+        if args.budget_ms is not None and result['median_ms'] > args.budget_ms:
+            failed = True
+            print(f"  FAIL: exceeds budget of {args.budget_ms} ms")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,328 @@
+"""End-to-end and per-component benchmarks of the explore pipeline against stub providers.
+
+Usage:
+    python benchmarks/run.py [--iterations 20] [--latency-ms 20] [--jitter-ms 5]
+                             [--concurrency 8] [--only main_cold,...] [--json results.json]
+                             [--baseline benchmarks/baseline.json] [--tolerance 0.25]
+                             [--min-delta-ms 1.0]
+                             [--update-baseline]
+
+Every provider is served by the local replay server (utils.replay) from
+synthetic fixtures, so runs need no network or API keys and are repeatable.
+Each scenario reports latency percentiles, throughput and the process's
+peak RSS so far. With --baseline, a scenario fails if its p50 latency
+exceeds the baseline's by more than --tolerance (and --min-delta-ms);
+baselines are only comparable on the machine that recorded them.
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from config import Config
+from utils import cache, replay
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+BASELINE_FILE = os.path.join(REPO_ROOT, 'benchmarks', 'baseline.json')
+
+CITIES = [
+    ("Paris", "FR"), ("Tokyo", "JP"), ("New York", "US"), ("Cairo", "EG"),
+    ("Moscow", "RU"), ("Istanbul", "TR"), ("Lagos", "NG"), ("Mumbai", "IN"),
+    ("Buenos Aires", "AR"), ("Manila", "PH"), ("Shanghai", "CN"), ("Karachi", "PK"),
+]
+
+ATTRACTION_XIDS = [f"N{i}" for i in range(5)]
+
+def write_synthetic_fixtures(fixture_dir):
+    """Write one representative response per provider endpoint"""
+    def add(provider, url, body):
+        replay.record(provider, url, {}, 200, json.dumps(body), fixture_dir)
+
+    add('ip-api', "http://ip-api.com/json/", {
+        'city': "Paris", 'country': "France", 'countryCode': "FR", 'lat': 48.8566, 'lon': 2.3522
+    })
+    add('nominatim', "https://nominatim.openstreetmap.org/search", [{
+        'display_name': "Springfield, Illinois, United States",
+        'lat': "39.7817", 'lon': "-89.6501", 'address': {'country_code': "us"}
+    }])
+    add('openweather', "https://api.openweathermap.org/data/2.5/weather", {
+        'main': {'temp': 18.5, 'humidity': 64},
+        'weather': [{'id': 801, 'main': "Clouds", 'description': "few clouds", 'icon': "02d"}],
+        'wind': {'speed': 3.6}
+    })
+    add('ticketmaster', "https://app.ticketmaster.com/discovery/v2/events.json", {
+        '_embedded': {'events': [{
+            'name': f"Concert {i}",
+            'url': f"https://example.com/events/{i}",
+            'dates': {'start': {'localDate': "2026-06-01"}},
+            '_embedded': {'venues': [{'name': "City Hall"}]},
+            'classifications': [{'segment': {'name': "Music"}}]
+        } for i in range(5)]},
+        'page': {'totalPages': 1}
+    })
+    add('opentripmap', "https://api.opentripmap.com/0.1/en/places/radius", [
+        {'xid': xid, 'name': f"Place {xid}"} for xid in ATTRACTION_XIDS
+    ])
+    for xid in ATTRACTION_XIDS:
+        add('opentripmap', f"https://api.opentripmap.com/0.1/en/places/xid/{xid}", {
+            'xid': xid,
+            'name': f"City Museum {xid}",
+            'kinds': "museums,cultural,interesting_places",
+            'wikipedia_extracts': {'text': "A museum of local history. " * 8}
+        })
+    for _, code in CITIES + [("", "us")]:
+        for variant in {code.upper(), code.lower()}:
+            add('restcountries', f"https://restcountries.com/v3.1/alpha/{variant}", [
+                {'name': {'common': f"Country {code.upper()}"}, 'capital': ["Capital"],
+                 'population': 1000000, 'flags': {'png': "https://example.com/flag.png"}}
+            ])
+
+def reset_cache(root):
+    """Point the response cache at an empty directory and drop the memory tier"""
+    Config.CACHE_DIR = tempfile.mkdtemp(dir=root)
+    cache.set_backend(None)
+    cache.memory_cache.clear()
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+def summarize(latencies, wall_seconds):
+    return {
+        'iterations': len(latencies),
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 3),
+        'p90_ms': round(percentile(latencies, 0.90) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+        'mean_ms': round(sum(latencies) / len(latencies) * 1000, 3),
+        'throughput_per_s': round(len(latencies) / wall_seconds, 2),
+        'peak_rss_mb': peak_rss_mb()
+    }
+
+def run_serial(call, iterations, setup=None):
+    """Time `call()` `iterations` times; `setup()` runs untimed before each call"""
+    latencies = []
+    wall = 0.0
+    for i in range(iterations):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        call(i)
+        elapsed = time.perf_counter() - start
+        latencies.append(elapsed)
+        wall += elapsed
+    return summarize(latencies, wall)
+
+def run_concurrent(call, iterations, concurrency):
+    """Run `call(i)` for every iteration on `concurrency` threads at once"""
+    def timed(i):
+        start = time.perf_counter()
+        call(i)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = list(executor.map(timed, range(iterations)))
+    return summarize(latencies, time.perf_counter() - start)
+
+def run_main(location):
+    """One full `python main.py --location ...` run, with its console output discarded"""
+    import main
+
+    argv = sys.argv
+    sys.argv = ['main.py', '--location', location]
+    try:
+        main.main()
+    finally:
+        sys.argv = argv
+
+def build_scenarios(args, root):
+    """Return {name: thunk} where each thunk runs one scenario and returns its summary"""
+    from api_clients import (
+        GeolocationClient, GeocodingClient, WeatherClient,
+        EventsClient, AttractionsClient, CountriesClient
+    )
+    from pipeline import Clients, explore
+
+    iterations = args.iterations
+    city = lambda i: CITIES[i % len(CITIES)]
+    cold = lambda: reset_cache(root)
+
+    def warm(call):
+        # Fill the cache untimed, then measure repeats of the same lookups
+        def thunk(memory):
+            reset_cache(root)
+            call(0)
+            setup = None if memory else cache.memory_cache.clear
+            return run_serial(lambda i: call(0), iterations, setup)
+        return thunk
+
+    def explore_city(i):
+        name, code = city(i)
+        explore(Clients(), {'city': name, 'countryCode': code, 'lat': 10.0 + i, 'lon': 20.0 + i})
+
+    def concurrent(warm_first):
+        def thunk():
+            reset_cache(root)
+            if warm_first:
+                for i in range(iterations):
+                    explore_city(i)
+            return run_concurrent(explore_city, iterations, args.concurrency)
+        return thunk
+
+    main_warm = warm(lambda i: run_main(city(i)[0]))
+    scenarios = {
+        'main_cold': lambda: run_serial(lambda i: run_main(city(i)[0]), iterations, cold),
+        'main_warm_disk': lambda: main_warm(False),
+        'main_warm_memory': lambda: main_warm(True),
+        'explore_concurrent_cold': concurrent(False),
+        'explore_concurrent_warm': concurrent(True),
+    }
+
+    clients = {
+        'geolocation': lambda i: GeolocationClient().get_location(),
+        'geocoding': lambda i: GeocodingClient().get_coordinates(f"Springfield {i}"),
+        'weather': lambda i: WeatherClient().get_weather(10.0 + i, 20.0 + i),
+        'events': lambda i: EventsClient().get_events(*city(i)),
+        'attractions': lambda i: AttractionsClient().get_attractions(10.0 + i, 20.0 + i),
+        'countries': lambda i: CountriesClient().get_country_info(city(i)[1]),
+    }
+    for name, call in clients.items():
+        scenarios[f'client_{name}_cold'] = (lambda call: lambda: run_serial(call, iterations, cold))(call)
+
+    class Payloads:
+        @cache.cache(ttl=3600)
+        def get(self, i):
+            return {'value': i, 'items': list(range(100))}
+
+    cached_payload = Payloads().get
+
+    def cache_miss_store():
+        reset_cache(root)
+        return run_serial(cached_payload, iterations)
+
+    scenarios.update({
+        'cache_miss_store': cache_miss_store,
+        'cache_disk_hit': lambda: warm(cached_payload)(False),
+        'cache_memory_hit': lambda: warm(cached_payload)(True),
+    })
+    return scenarios
+
+def compare(results, baseline, tolerance, min_delta_ms):
+    """Return a list of regression messages against the baseline's p50 latencies.
+
+    A scenario regresses when its p50 exceeds the baseline's by both the
+    relative `tolerance` and `min_delta_ms`, so microsecond-scale scenarios
+    don't fail on timer noise.
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get('scenarios', {}).get(name)
+        if not reference:
+            continue
+        limit = max(reference['p50_ms'] * (1 + tolerance), reference['p50_ms'] + min_delta_ms)
+        if result['p50_ms'] > limit:
+            regressions.append(
+                f"{name}: p50 {result['p50_ms']:.3f} ms > {limit:.3f} ms "
+                f"(baseline {reference['p50_ms']:.3f} ms)"
+            )
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20, help="Timed runs per scenario")
+    parser.add_argument("--latency-ms", type=float, default=20, help="Stub provider response delay")
+    parser.add_argument("--jitter-ms", type=float, default=5, help="Random +/- variation of the delay")
+    parser.add_argument("--concurrency", type=int, default=8, help="Threads in the concurrent scenarios")
+    parser.add_argument("--only", help="Comma-separated scenario names to run")
+    parser.add_argument("--keep-rate-limits", action="store_true",
+                        help="Apply Config.RATE_LIMITS to the stub providers too")
+    parser.add_argument("--json", metavar="PATH", help="Write results as JSON")
+    parser.add_argument("--baseline", metavar="PATH", help="Fail on p50 regressions against this file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed p50 slowdown (0.25 = 25%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0,
+                        help="Ignore p50 slowdowns smaller than this")
+    parser.add_argument("--update-baseline", action="store_true", help=f"Write results to {BASELINE_FILE}")
+    args = parser.parse_args(argv)
+    args.iterations = max(1, args.iterations)
+
+    root = tempfile.mkdtemp(prefix="explorer-bench-")
+    try:
+        fixture_dir = os.path.join(root, 'fixtures')
+        write_synthetic_fixtures(fixture_dir)
+        server = replay.start_server(
+            fixture_dir, latency=args.latency_ms / 1000, jitter=args.jitter_ms / 1000
+        )
+        Config.PROVIDER_URL_OVERRIDE = server.url
+        Config.RECORD_DIR = None
+        if not args.keep_rate_limits:
+            Config.RATE_LIMITS = {}
+
+        scenarios = build_scenarios(args, root)
+        selected = args.only.split(',') if args.only else list(scenarios)
+        unknown = [name for name in selected if name not in scenarios]
+        if unknown:
+            parser.error(f"Unknown scenarios: {', '.join(unknown)}")
+
+        results = {}
+        for name in selected:
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                results[name] = scenarios[name]()
+            result = results[name]
+            print(f"{name:28} p50 {result['p50_ms']:9.2f} ms  p90 {result['p90_ms']:9.2f} ms  "
+                  f"p99 {result['p99_ms']:9.2f} ms  {result['throughput_per_s']:9.1f}/s  "
+                  f"RSS {result['peak_rss_mb']} MB")
+        server.shutdown()
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'iterations': args.iterations,
+            'latency_ms': args.latency_ms,
+            'jitter_ms': args.jitter_ms,
+            'concurrency': args.concurrency
+        },
+        'scenarios': results
+    }
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.update_baseline:
+        with open(BASELINE_FILE, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance, args.min_delta_ms)
+        for message in regressions:
+            print(f"REGRESSION: {message}")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,4 +10,91 @@ class Config:
     
     CACHE_ENABLED = True
     CACHE_DIR = ".cache"
-    CACHE_TTL = 3600 
\ No newline at end of file
+    CACHE_TTL = 3600
+    CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'sqlite')  # 'sqlite' or 'file'
+    CACHE_DB_FILE = "cache.sqlite3"
+    CACHE_MAX_BYTES = 256 * 1024 * 1024
+    CACHE_SWEEP_INTERVAL = 600  # Seconds between automatic expiry sweeps
+    ICON_CACHE_DIR = os.path.join(CACHE_DIR, "icons")
+    CACHE_MEMORY_ENABLED = True
+    CACHE_MEMORY_MAX_ENTRIES = 1024
+    CACHE_MEMORY_MAX_BYTES = 32 * 1024 * 1024
+    # Serve stale entries while refreshing them in the background. Only long-running
+    # modes (--serve, GUI) turn this on: a one-shot run would exit before the refresh lands.
+    CACHE_SERVE_STALE = False
+
+    # Geohash precision used to share cache entries between nearby coordinates
+    WEATHER_GEOHASH_PRECISION = 5  # ~4.9 km cells
+    ATTRACTIONS_GEOHASH_PRECISION = 6  # ~1.2 km cells
+
+    # Provider cache lifetimes
+    WEATHER_CACHE_TTL = 600  # OpenWeather refreshes current conditions about every 10 minutes
+    GEOCODING_CACHE_TTL = 30 * 86400
+
+    # Offline city lookup used before falling back to Nominatim
+    GAZETTEER_ENABLED = True
+    GAZETTEER_FILE = os.getenv(
+        'GAZETTEER_FILE',
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), 'api_clients', 'data', 'cities.csv')
+    )
+    GAZETTEER_MIN_PREFIX = 4  # Shorter queries only match city names exactly
+
+    # Concurrent provider fetches
+    FETCH_MAX_WORKERS = 4
+    PROVIDER_TIMEOUT = 15
+    PROVIDER_TIMEOUTS = {
+        'weather': 8,
+        'events': 12,
+        'attractions': 20,
+        'country': 8
+    }
+
+    # Concurrent OpenTripMap place detail lookups
+    ATTRACTION_DETAIL_WORKERS = 5
+
+    # Paging for the GUI's event and attraction lists
+    LIST_PAGE_SIZE = 20
+    EVENTS_MAX_RESULTS = 1000  # Ticketmaster refuses pages past size * page = 1000
+    EVENTS_PAGE_SIZE = 50  # Page size when streaming events with iter_events
+    EVENTS_RADIUS_KM = 25  # Default radius for lat/lon event queries
+    EVENTS_GEOHASH_PRECISION = 6  # ~1.2 km cells
+    ATTRACTIONS_MAX_RESULTS = 500  # OpenTripMap's largest radius query limit
+
+    # Locations explored at once in --locations-file batch mode
+    BATCH_CONCURRENCY = 8
+
+    # --serve HTTP service
+    SERVE_HOST = os.getenv('SERVE_HOST', '127.0.0.1')
+    SERVE_PORT = int(os.getenv('SERVE_PORT', '8080'))
+    SERVE_WORKERS = 32
+
+    # GUI auto-refresh period in seconds (0 disables; the refresh button always works)
+    GUI_REFRESH_INTERVAL = int(os.getenv('GUI_REFRESH_INTERVAL', '600'))
+
+    # Per-provider rate limits as (requests per second, burst); None means unlimited
+    RATE_LIMITS = {
+        'nominatim': (1.0, 1),  # Nominatim usage policy: at most 1 request per second
+        'ticketmaster': (5.0, 5),
+        'opentripmap': (10.0, 10),
+        'openweather': (1.0, 10),  # Free plan: 60 calls per minute
+        'ip-api': (0.75, 5),  # 45 requests per minute
+        'restcountries': None
+    }
+
+    # Record/replay: RECORD_DIR saves every provider response as a fixture;
+    # PROVIDER_URL_OVERRIDE sends requests to <override>/<provider><path> instead,
+    # e.g. the stand-in server started with `python -m utils.replay <RECORD_DIR>`
+    RECORD_DIR = os.getenv('RECORD_DIR')
+    PROVIDER_URL_OVERRIDE = os.getenv('PROVIDER_URL_OVERRIDE')
+
+    # Timing spans and cache/upstream counters (also enabled by --metrics-out)
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', '').lower() in ('1', 'true', 'yes')
+
+    # Allocation sites listed per stage by --profile
+    PROFILE_TOP_N = 15
+
+    # Shared HTTP session used by every API client
+    HTTP_CONNECT_TIMEOUT = 3.05
+    HTTP_READ_TIMEOUT = 10
+    HTTP_POOL_CONNECTIONS = 10  # Number of per-host pools kept alive
+    HTTP_POOL_MAXSIZE = 10  # Connections kept per host
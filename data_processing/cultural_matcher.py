@@ -1,4 +1,21 @@
+from collections import defaultdict
+
 class CulturalMatcher:
+    """Ranks activity suggestions for a location's weather, attractions and events.
+
+    Candidates come from three sources: the static weather suggestions, each
+    attraction (matched through its OpenTripMap kinds) and each event
+    (matched through its Ticketmaster segment). Matches are scored by the
+    base weight of their keyword, scaled by how well an indoor or outdoor
+    activity suits the weather and decayed by the item's position in its
+    list. Every source keeps its reserved SLOTS, so a city full of museums
+    can't crowd out the weather suggestions, and the picks are interleaved
+    by source. Only activities the weather suits (a setting factor of at
+    least 1) may take a reserved slot: a park on a freezing day competes on
+    its score alone. Duplicates keep their best score and ties are broken
+    alphabetically, so the same input always yields the same suggestions.
+    """
+
     SUGGESTIONS = {
         'temperature': {
             'freezing': ["Visit museums", "Try local cuisine indoors", "See indoor shows"],
@@ -14,20 +31,166 @@ class CulturalMatcher:
             'cloudy': ["Long museum visits", "Factory tours", "Workshops"]
         }
     }
-    
+
+    # OpenTripMap kind -> (setting, suggestion template, base weight)
+    KINDS = {
+        'museums': ('indoor', "Visit {}", 3.0),
+        'theatres_and_entertainments': ('indoor', "See a show at {}", 2.5),
+        'gardens_and_parks': ('outdoor', "Explore {}", 2.5),
+        'beaches': ('outdoor', "Relax at {}", 2.5),
+        'view_points': ('outdoor', "Take in the view from {}", 2.0),
+        'natural': ('outdoor', "Explore {}", 2.0),
+        'historic': ('outdoor', "Explore {}", 2.0),
+        'architecture': ('outdoor', "See {}", 1.5),
+        'religion': ('indoor', "Visit {}", 1.5),
+        'foods': ('indoor', "Eat at {}", 1.5),
+        'cultural': ('any', "Visit {}", 1.0),
+    }
+    # Places without kinds (e.g. failed detail lookups) are matched on their name
+    NAME_KEYWORDS = {
+        'museum': 'museums',
+        'gallery': 'museums',
+        'theatre': 'theatres_and_entertainments',
+        'theater': 'theatres_and_entertainments',
+        'park': 'gardens_and_parks',
+        'garden': 'gardens_and_parks',
+        'beach': 'beaches',
+    }
+    # Ticketmaster segment (lowercase) -> (setting, suggestion template, base weight)
+    EVENT_CATEGORIES = {
+        'music': ('indoor', "Catch {}", 2.0),
+        'arts & theatre': ('indoor', "See {}", 2.0),
+        'film': ('indoor', "Watch {}", 1.5),
+        'sports': ('outdoor', "Watch {}", 1.5),
+        'miscellaneous': ('any', "Check out {}", 1.0),
+    }
+    STATIC_WEIGHT = 2.0
+    # Missing temperature/condition categories count as 1.0
+    SETTING_WEIGHTS = {
+        'indoor': {'freezing': 1.5, 'cold': 1.3, 'warm': 0.8, 'hot': 0.9,
+                   'rainy': 1.5, 'snowy': 1.4, 'clear': 0.8, 'cloudy': 1.1},
+        'outdoor': {'freezing': 0.3, 'cold': 0.6, 'cool': 1.2, 'warm': 1.5, 'hot': 1.1,
+                    'rainy': 0.4, 'snowy': 0.6, 'clear': 1.4},
+        'any': {}
+    }
+    POSITION_DECAY = 0.05  # Earlier (closer, sooner) items rank slightly higher
+    LIMIT = 5
+    # Slots reserved for each source's best suggestions; any a source can't fill
+    # go to the best remaining candidates from the other sources
+    SLOTS = {'weather': 2, 'attractions': 2, 'events': 1}
+
     @classmethod
     def generate_suggestions(cls, weather_cat, attractions, events):
-        temp_cat, cond_cat = weather_cat
+        return cls.generate_suggestions_batch([(weather_cat, attractions, events)])[0]
+
+    @classmethod
+    def generate_suggestions_batch(cls, locations):
+        """Suggestions for many locations at once.
+
+        `locations` is an iterable of (weather_cat, attractions, events) tuples;
+        returns one suggestion list per location, in the same order. Scores for
+        every kind and event category are computed once per weather category
+        in the batch, and each distinct kinds string is resolved once.
+        """
+        tables = {}
+        results = []
+        for weather_cat, attractions, events in locations:
+            table = tables.get(weather_cat)
+            if table is None:
+                table = tables[weather_cat] = _ScoreTable(cls, *weather_cat)
+            results.append(cls._rank(table, attractions or [], events or []))
+        return results
+
+    @classmethod
+    def _rank(cls, table, attractions, events):
+        best = {}  # casefolded text -> (score, text, source, suits the weather)
+
+        def add(text, score, source, suited):
+            key = text.casefold()
+            if key not in best or score > best[key][0]:
+                best[key] = (score, text, source, suited)
+
+        for text, score in table.static:
+            add(text, score, 'weather', True)
+
+        for position, attr in enumerate(attractions):
+            name = attr.get('name')
+            match = name and table.match_attraction(attr.get('kinds') or '', name.lower())
+            if match:
+                template, score, suited = match
+                add(template.format(name), score * _decay(cls, position), 'attractions', suited)
+
+        for position, event in enumerate(events):
+            title = event.get('title')
+            match = title and table.events.get((event.get('category') or '').lower())
+            if match:
+                template, score, suited = match
+                add(template.format(title), score * _decay(cls, position), 'events', suited)
+
+        ranked = sorted(best.values(), key=lambda item: (-item[0], item[1]))
+        if not ranked:
+            return []
+
+        # Reserved slots first (weather-appropriate candidates only), then the best of what's left
+        chosen = defaultdict(list)
+        for item in ranked:
+            if item[3] and len(chosen[item[2]]) < cls.SLOTS.get(item[2], 0):
+                chosen[item[2]].append(item)
+        picked = {item[1] for items in chosen.values() for item in items}
+        for item in ranked:
+            if len(picked) >= cls.LIMIT:
+                break
+            if item[1] not in picked:
+                chosen[item[2]].append(item)
+                picked.add(item[1])
+        for items in chosen.values():
+            items.sort(key=lambda item: (-item[0], item[1]))
+
+        # Interleave sources, the one with the best pick first
+        queues = sorted(chosen.values(), key=lambda items: (-items[0][0], items[0][1]))
         suggestions = []
-        
-        suggestions.extend(cls.SUGGESTIONS['temperature'].get(temp_cat, []))
-        suggestions.extend(cls.SUGGESTIONS['condition'].get(cond_cat, []))
-        
-        for attr in attractions[:3]:
-            name = attr.get('name', '').lower()
-            if 'museum' in name:
-                suggestions.append(f"Visit {attr['name']}")
-            elif 'park' in name and temp_cat in ['cool', 'warm']:
-                suggestions.append(f"Explore {attr['name']}")
-        
-        return list(set(suggestions))[:5]
\ No newline at end of file
+        for round_ in range(max(len(items) for items in queues)):
+            suggestions.extend(items[round_][1] for items in queues if round_ < len(items))
+        return suggestions[:cls.LIMIT]
+
+class _ScoreTable:
+    """Keyword scores for one (temperature, condition) category pair"""
+
+    def __init__(self, matcher, temp_cat, cond_cat):
+        self.static = [
+            (text, matcher.STATIC_WEIGHT * _decay(matcher, position))
+            for suggestions in (matcher.SUGGESTIONS['temperature'].get(temp_cat, []),
+                                matcher.SUGGESTIONS['condition'].get(cond_cat, []))
+            for position, text in enumerate(suggestions)
+        ]
+        # keyword -> (template, score, whether the weather suits it)
+        self.kinds = {
+            kind: _score(matcher, entry, temp_cat, cond_cat) for kind, entry in matcher.KINDS.items()
+        }
+        self.events = {
+            category: _score(matcher, entry, temp_cat, cond_cat)
+            for category, entry in matcher.EVENT_CATEGORIES.items()
+        }
+        self._name_keywords = matcher.NAME_KEYWORDS
+        self._matches = {}  # kinds string -> best (template, score, suited) or None
+
+    def match_attraction(self, kinds, name):
+        """Best (template, score, suited) among a comma-separated kinds string, or None"""
+        if not kinds:
+            kinds = ','.join(kind for keyword, kind in self._name_keywords.items() if keyword in name)
+        if kinds not in self._matches:
+            matches = [self.kinds[kind] for kind in map(str.strip, kinds.split(',')) if kind in self.kinds]
+            self._matches[kinds] = max(matches, key=lambda match: match[1], default=None)
+        return self._matches[kinds]
+
+def _decay(matcher, position):
+    return 1 / (1 + matcher.POSITION_DECAY * position)
+
+def _score(matcher, entry, temp_cat, cond_cat):
+    setting, template, weight = entry
+    factor = _setting_factor(matcher, setting, temp_cat, cond_cat)
+    return template, weight * factor, factor >= 1
+
+def _setting_factor(matcher, setting, temp_cat, cond_cat):
+    weights = matcher.SETTING_WEIGHTS[setting]
+    return weights.get(temp_cat, 1.0) * weights.get(cond_cat, 1.0)
@@ -1,17 +1,30 @@
+from bisect import bisect_right
+
 class WeatherAnalyzer:
-    @staticmethod
-    def get_weather_category(weather_data):
-        temp = weather_data['temp']
+    TEMPERATURE_BINS = [0, 10, 20, 30]  # Lower bounds (°C) of every category after 'freezing'
+    TEMPERATURE_CATEGORIES = ('freezing', 'cold', 'cool', 'warm', 'hot')
+    CONDITION_CATEGORIES = ('rainy', 'snowy', 'clear', 'cloudy', 'other')
+
+    # OpenWeather condition ID -> index into CONDITION_CATEGORIES, for IDs 0-999.
+    # Groups: 2xx thunderstorm, 3xx drizzle, 5xx rain, 6xx snow, 7xx atmosphere,
+    # 800 clear, 80x clouds. Unknown IDs are 'other'.
+    CONDITION_TABLE = [4] * 1000
+    CONDITION_TABLE[500:600] = [0] * 100
+    CONDITION_TABLE[600:700] = [1] * 100
+    CONDITION_TABLE[800] = 2
+    CONDITION_TABLE[801:805] = [3] * 4
+    _arrays = None  # numpy copies of the tables above, built on first batch call
+
+    @classmethod
+    def get_weather_category(cls, weather_data):
+        temp_cat = cls.TEMPERATURE_CATEGORIES[bisect_right(cls.TEMPERATURE_BINS, weather_data['temp'])]
+
+        condition_id = weather_data.get('condition_id')
+        if condition_id is not None:
+            return temp_cat, cls._condition_category(condition_id)
+
+        # Entries cached before condition IDs were stored only have the group name
         conditions = weather_data['conditions'].lower()
-        
-        temp_cat = (
-            'freezing' if temp < 0 else
-            'cold' if temp < 10 else
-            'cool' if temp < 20 else
-            'warm' if temp < 30 else
-            'hot'
-        )
-        
         cond_cat = (
             'rainy' if 'rain' in conditions else
             'snowy' if 'snow' in conditions else
@@ -19,9 +32,46 @@ class WeatherAnalyzer:
             'cloudy' if 'cloud' in conditions else
             'other'
         )
-        
+
         return temp_cat, cond_cat
-    
+
+    @classmethod
+    def categorize_batch(cls, temps, condition_ids):
+        """Categorize many readings at once (locations or forecast timesteps).
+
+        Takes array-likes of temperatures (°C) and OpenWeather condition IDs
+        of equal length and returns (temperature categories, condition
+        categories) as numpy string arrays, computed in one vectorized pass.
+        Requires numpy.
+        """
+        import numpy as np
+
+        temps = np.asarray(temps, dtype=float)
+        ids = np.asarray(condition_ids, dtype=np.int64)
+        if temps.shape != ids.shape:
+            raise ValueError(f"Got {temps.shape} temperatures for {ids.shape} condition IDs")
+
+        if cls._arrays is None:
+            cls._arrays = (
+                np.asarray(cls.TEMPERATURE_BINS, dtype=float),
+                np.asarray(cls.CONDITION_TABLE, dtype=np.int8),
+                np.asarray(cls.TEMPERATURE_CATEGORIES),
+                np.asarray(cls.CONDITION_CATEGORIES)
+            )
+        bins, table, temp_names, cond_names = cls._arrays
+
+        temp_index = np.digitize(temps, bins)
+        known = (ids >= 0) & (ids < len(table))
+        cond_index = np.where(known, table[np.where(known, ids, 0)], len(cond_names) - 1)
+
+        return temp_names[temp_index], cond_names[cond_index]
+
+    @classmethod
+    def _condition_category(cls, condition_id):
+        if 0 <= condition_id < len(cls.CONDITION_TABLE):
+            return cls.CONDITION_CATEGORIES[cls.CONDITION_TABLE[condition_id]]
+        return 'other'
+
     @staticmethod
     def get_weather_icon(icon_code):
-        return f"https://openweathermap.org/img/wn/{icon_code}@2x.png"
\ No newline at end of file
+        return f"https://openweathermap.org/img/wn/{icon_code}@2x.png"
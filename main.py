@@ -1,73 +1,101 @@
+import sys
 import argparse
-from api_clients import (
-    GeolocationClient,
-    GeocodingClient,
-    WeatherClient,
-    EventsClient,
-    AttractionsClient,
-    CountriesClient
-)
-from data_processing import WeatherAnalyzer, CulturalMatcher
-from output import ConsoleOutput, CulturalWeatherGUI
+from pipeline import Clients, resolve_location, explore
+from output import ConsoleOutput
+from config import Config
+from utils.metrics import metrics
+
+# Modes beyond a single console lookup import their dependencies (asyncio,
+# http.server, tkinter/PIL) only when selected, to keep CLI startup fast.
 
 def main():
-    # Initialize all clients
-    geo_client = GeolocationClient()
-    geocode_client = GeocodingClient()
-    weather_client = WeatherClient()
-    events_client = EventsClient()
-    attractions_client = AttractionsClient()
-    countries_client = CountriesClient()
+    # Clients are built on demand as the pipeline first uses them
+    clients = Clients()
 
     # Parse CLI arguments
     parser = argparse.ArgumentParser(description="Cultural Weather Explorer")
     parser.add_argument("--location", help="City or address to analyze")
     parser.add_argument("--gui", action="store_true", help="Launch GUI interface")
+    parser.add_argument("--locations-file", metavar="PATH",
+                        help="Explore every location in a file ('-' for stdin), writing one JSON line per location")
+    parser.add_argument("--output", metavar="PATH", default="-",
+                        help="Where batch mode writes JSON lines (default: stdout)")
+    parser.add_argument("--concurrency", type=int, default=Config.BATCH_CONCURRENCY,
+                        help="Locations processed at once in batch mode")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="Drive the whole pipeline on a single asyncio event loop")
+    parser.add_argument("--serve", action="store_true",
+                        help="Run a local HTTP/JSON service (GET /explore?location=...) with warm caches")
+    parser.add_argument("--host", default=Config.SERVE_HOST, help="Address for --serve to bind")
+    parser.add_argument("--port", type=int, default=Config.SERVE_PORT, help="Port for --serve to listen on")
+    parser.add_argument("--profile", metavar="DIR",
+                        help="Profile each pipeline stage (cProfile + tracemalloc), writing "
+                             "<stage>.pstats files and allocations.txt to DIR")
+    parser.add_argument("--metrics-out", metavar="PATH",
+                        help="Record timing spans and cache/upstream counters, written here on exit "
+                             "(Prometheus text for .prom/.txt, JSON otherwise)")
     args = parser.parse_args()
+    if args.profile and args.use_async:
+        parser.error("--profile needs each stage on its own thread and can't be combined with --async")
 
-    # Get location data
-    if args.location:
-        location_data = geocode_client.get_coordinates(args.location)
-    else:
-        location_data = geo_client.get_location()
-    
-    if not location_data:
-        print("Error: Could not determine location")
+    if args.metrics_out:
+        metrics.enabled = True
+    if args.profile:
+        from utils import profiling
+        profiling.start(args.profile)
+    try:
+        run(clients, args)
+    finally:
+        if args.metrics_out:
+            metrics.write(args.metrics_out)
+        if args.profile:
+            print(f"Profiles written to {args.profile}:", file=sys.stderr)
+            print(profiling.stop(), file=sys.stderr, end="")
+
+def run(clients, args):
+    """Dispatch to the mode selected on the command line"""
+    if args.serve:
+        from server import serve
+        Config.CACHE_SERVE_STALE = True  # The process outlives background refreshes
+        serve(clients, args.host, args.port, Config.SERVE_WORKERS)
         return
 
-    # Fetch all data
-    data = {
-        'weather': weather_client.get_weather(location_data['lat'], location_data['lon']),
-        'events': events_client.get_events(location_data['city'], location_data.get('countryCode', 'us')),
-        'attractions': attractions_client.get_attractions(location_data['lat'], location_data['lon']),
-        'country': countries_client.get_country_info(location_data.get('countryCode', 'us'))
-    }
+    if args.locations_file:
+        from batch import run_batch_file
+        failures = run_batch_file(clients, args.locations_file, args.output,
+                                  max(1, args.concurrency), use_async=args.use_async)
+        sys.exit(1 if failures else 0)
 
-    # Process data
-    weather_cat = WeatherAnalyzer.get_weather_category(data['weather'])
-    suggestions = CulturalMatcher.generate_suggestions(
-        weather_cat,
-        data['attractions'],
-        data['events']
-    )
+    if args.gui and not args.use_async:
+        # Open the window right away and fill each section as its provider answers
+        from output import CulturalWeatherGUI
+        from pipeline import explore_progressively
+        Config.CACHE_SERVE_STALE = True
+        gui = CulturalWeatherGUI({})
+        gui.load_in_background(lambda publish: explore_progressively(clients, args.location, publish))
+        gui.run()
+        return
 
-    # Prepare output
-    output = {
-        'location': {
-            'city': location_data['city'],
-            'country': data['country']['name']['common'] if data['country'] else 'Unknown'
-        },
-        'weather': data['weather'],
-        'events': data['events'],
-        'attractions': data['attractions'],
-        'suggestions': suggestions
-    }
+    if args.use_async:
+        import asyncio
+        from pipeline import run_async
+        output = asyncio.run(run_async(args.location))
+    else:
+        # Get location data, then fetch, process and prepare output
+        location_data = resolve_location(clients, args.location)
+        output = explore(clients, location_data) if location_data else None
+    
+    if not output:
+        print("Error: Could not determine location")
+        return
 
     # Display results
     if args.gui:
+        from output import CulturalWeatherGUI
         CulturalWeatherGUI(output).run()
     else:
-        ConsoleOutput.display(output)
+        with metrics.span('render'):
+            ConsoleOutput.display(output)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
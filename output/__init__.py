@@ -1,7 +1,13 @@
 from .console_output import ConsoleOutput
-from .gui_output import CulturalWeatherGUI
 
 __all__ = [
     'ConsoleOutput',
     'CulturalWeatherGUI'
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    # tkinter and PIL are only loaded when the GUI is actually requested
+    if name == 'CulturalWeatherGUI':
+        from .gui_output import CulturalWeatherGUI
+        return CulturalWeatherGUI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
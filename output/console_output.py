@@ -2,7 +2,10 @@ class ConsoleOutput:
     @staticmethod
     def display(data):
         print(f"\n🌍 {data['location']['city']}, {data['location']['country']}")
-        print(f"🌤️ {data['weather']['description']}, {data['weather']['temp']}°C")
+        if data['weather']:
+            print(f"🌤️ {data['weather']['description']}, {data['weather']['temp']}°C")
+        else:
+            print("🌤️ Weather data unavailable")
         
         print("\n🎭 Top Events:")
         for event in data['events'][:3]:
@@ -1,15 +1,19 @@
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk
-import io
-import requests
+from PIL import ImageTk
+import queue
+import threading
 import time
 import webbrowser
-from typing import Dict, Any
+from typing import Dict, Any, Callable
+from config import Config
+from utils.metrics import metrics
+from .icon_cache import icon_cache
+from .virtual_list import VirtualList
 
 class CulturalWeatherGUI:
     """Enhanced graphical user interface with themes for Cultural Weather Explorer"""
-    
+
     THEMES = {
         "light": {
             "bg": "#ffffff",
@@ -30,184 +34,397 @@ class CulturalWeatherGUI:
             "secondary": "#eac4a3"
         }
     }
-    
+
+    SECTIONS = ('location', 'weather', 'events', 'attractions', 'suggestions')
+
     def __init__(self, data: Dict[str, Any]):
-        """Initialize the GUI with weather and cultural data"""
+        """Initialize the GUI with weather and cultural data.
+
+        Sections missing from `data` (or None) show a loading state until they
+        are delivered through `update_section`, e.g. by `load_in_background`.
+        """
         self.root = tk.Tk()
         self.root.title("Cultural Weather Explorer")
         self.root.geometry("950x700")
-        self.data = data
+        self.data = {section: data.get(section) for section in self.SECTIONS}
+        self._ui_queue = queue.Queue()
+        self._loader = None
+        self._loading = False
+        self._weather_widgets = None
+        self._pager = None
+        self._paging = set()  # List sections with a page request in flight
+        self._exhausted = set()  # List sections with no further pages
         self.theme = self._select_theme_from_weather()
         self._configure_styles()
         self.setup_ui()
-    
+        self.root.after(50, self._poll_ui_queue)
+
+    def load_in_background(self, loader: Callable[[Callable[[str, Any], None]], Any]):
+        """Run `loader(publish)` on a worker thread, and again on every refresh.
+
+        Every `publish(section, value)` call renders that section on the Tk
+        thread as soon as the main loop picks it up; publishing 'error' shows
+        a message in the status bar. Auto-refresh runs every
+        Config.GUI_REFRESH_INTERVAL seconds (0 disables it).
+        """
+        self._loader = loader
+        self.refresh()
+        if Config.GUI_REFRESH_INTERVAL > 0:
+            self.root.after(Config.GUI_REFRESH_INTERVAL * 1000, self._auto_refresh)
+
+    def refresh(self):
+        """Refetch all sections in the background, unless a fetch is already running"""
+        if self._loader is None or self._loading:
+            return
+        self._loading = True
+        self._refresh_button.state(["disabled"])
+
+        def publish(section, value):
+            self._ui_queue.put((lambda value: self.update_section(section, value), value))
+
+        def runner():
+            try:
+                self._loader(publish)
+            except Exception as e:
+                publish('error', f"Error: {e}")
+            self._ui_queue.put((lambda _: self._refresh_finished(), None))
+
+        threading.Thread(target=runner, daemon=True).start()
+
+    def _refresh_finished(self):
+        self._loading = False
+        self._refresh_button.state(["!disabled"])
+
+    def _auto_refresh(self):
+        self.refresh()
+        self.root.after(Config.GUI_REFRESH_INTERVAL * 1000, self._auto_refresh)
+
+    def update_section(self, section: str, value: Any):
+        """Store a section's data and re-render the widgets that show it.
+
+        Values equal to what is already displayed leave the widgets untouched,
+        so a refresh only redraws the sections that actually changed.
+        """
+        with metrics.span('render', section=section):
+            self._update_section(section, value)
+
+    def _update_section(self, section: str, value: Any):
+        if section == 'error':
+            self._status_label.configure(text=value)
+            return
+
+        if section == 'pager':
+            self._pager = value
+            self._exhausted.clear()
+            return
+
+        self._status_label.configure(text=f"Data last updated: {time.strftime('%H:%M:%S')}")
+        previous = self.data[section]
+        if value == previous:
+            return
+        if section in ('events', 'attractions') and value and previous and previous[:len(value)] == value:
+            return  # A refreshed first page still matches; keep the pages loaded since
+
+        self.data[section] = value
+        if section == 'location':
+            self._render_location()
+        elif section == 'weather':
+            theme = self._select_theme_from_weather()
+            if theme != self.theme:
+                self._apply_theme(theme)
+            self._render_weather()
+        elif section in ('events', 'attractions'):
+            self._exhausted.discard(section)
+            if section == 'events':
+                self._render_events()
+            else:
+                self._render_attractions()
+            # Highlights only show the first item of each list
+            if not previous or not value or previous[0] != value[0]:
+                self._render_highlights()
+        elif section == 'suggestions':
+            self._render_suggestions()
+
+    def _run_in_background(self, work: Callable[[], Any], on_done: Callable[[Any], None]):
+        """Run `work` on a daemon thread and pass its result to `on_done` on the Tk thread.
+
+        Tk is not thread-safe, so results are handed over through a queue that
+        the main loop polls. `on_done` receives None if `work` raised.
+        """
+        def runner():
+            try:
+                result = work()
+            except Exception:
+                result = None
+            self._ui_queue.put((on_done, result))
+
+        threading.Thread(target=runner, daemon=True).start()
+
+    def _poll_ui_queue(self):
+        """Apply results handed over by background workers"""
+        try:
+            while True:
+                on_done, result = self._ui_queue.get_nowait()
+                on_done(result)
+        except queue.Empty:
+            pass
+        self.root.after(50, self._poll_ui_queue)
+
     def _select_theme_from_weather(self) -> str:
         """Select theme based on weather conditions"""
-        if 'weather' not in self.data:
+        if not self.data.get('weather'):
             return "light"
-            
+
         conditions = self.data['weather']['conditions'].lower()
         temp = self.data['weather']['temp']
-        
+
         if 'clear' in conditions:
             return "sunset" if temp > 25 else "light"
         return "dark"
-    
+
     def _configure_styles(self):
         """Configure ttk styles for the selected theme"""
         theme = self.THEMES[self.theme]
         style = ttk.Style()
         style.theme_use('clam')
-        
+
         # Base styles
-        style.configure(".", 
+        style.configure(".",
                       background=theme["bg"],
                       foreground=theme["fg"],
                       font=('Segoe UI', 10))
-        
+
         # Component styles
         style.configure("TFrame", background=theme["bg"])
         style.configure("TLabel", background=theme["bg"], foreground=theme["fg"])
         style.configure("TButton", background=theme["accent"], foreground="#000000")
         style.configure("TNotebook", background=theme["bg"], tabmargins=[2, 5, 2, 0])
-        style.configure("TNotebook.Tab", 
+        style.configure("TNotebook.Tab",
                       background=theme["secondary"],
                       foreground=theme["fg"],
                       padding=[10, 2])
-        
+
         # Style maps
         style.map("TNotebook.Tab",
                 background=[("selected", theme["accent"])],
                 foreground=[("selected", "#000000")])
-        
+
         self.root.configure(background=theme["bg"])
-    
+
+    def _apply_theme(self, theme_name: str):
+        """Switch themes in place, recoloring tk widgets that use the old theme's colors"""
+        old, new = self.THEMES[self.theme], self.THEMES[theme_name]
+        background_map = {old[key]: new[key] for key in ("bg", "accent", "secondary")}
+        foreground_map = {old["fg"]: new["fg"]}
+
+        self.theme = theme_name
+        self._configure_styles()
+
+        pending = [self.root]
+        while pending:
+            widget = pending.pop()
+            pending.extend(widget.winfo_children())
+            if isinstance(widget, ttk.Widget):
+                continue  # Styled through ttk.Style
+            for option, color_map in (("background", background_map),
+                                      ("highlightbackground", background_map),
+                                      ("foreground", foreground_map)):
+                try:
+                    color = widget.cget(option)
+                except tk.TclError:
+                    continue
+                if color in color_map:
+                    widget.configure(**{option: color_map[color]})
+
     def setup_ui(self):
         """Setup the main user interface"""
         main_frame = ttk.Frame(self.root, padding="15")
         main_frame.pack(fill=tk.BOTH, expand=True)
-        
+
         self._create_top_bar(main_frame)
         self._create_enhanced_weather_display(main_frame)
-        
+
         notebook = ttk.Notebook(main_frame)
         notebook.pack(fill=tk.BOTH, expand=True, pady=15)
-        
+
         # Create tabs
         tabs = [
             ("🏠 Home", self._create_home_tab),
             ("🎭 Events", self._create_events_tab),
             ("🏛️ Attractions", self._create_attractions_tab)
         ]
-        
+
         for tab_text, tab_creator in tabs:
             tab_frame = ttk.Frame(notebook)
             tab_creator(tab_frame)
             notebook.add(tab_frame, text=tab_text)
-        
+
         self._create_status_bar(main_frame)
-    
+
+        # Fill in every section whose data is already available
+        self._render_location()
+        self._render_weather()
+        self._render_suggestions()
+        self._render_highlights()
+        self._render_events()
+        self._render_attractions()
+
     def _create_top_bar(self, parent):
         """Create the top location bar"""
-        theme = self.THEMES[self.theme]
         frame = ttk.Frame(parent)
         frame.pack(fill=tk.X, pady=(0, 10))
-        
-        location_text = f"🌍 {self.data['location']['city']}"
-        ttk.Label(
-            frame, 
-            text=location_text,
+
+        self._location_label = ttk.Label(
+            frame,
             font=('Segoe UI', 18, 'bold')
-        ).pack(side=tk.LEFT)
-        
-        # Future: Add refresh/settings buttons here
+        )
+        self._location_label.pack(side=tk.LEFT)
+
         controls_frame = ttk.Frame(frame)
         controls_frame.pack(side=tk.RIGHT)
-    
+
+        self._refresh_button = ttk.Button(
+            controls_frame,
+            text="⟳ Refresh",
+            command=self.refresh
+        )
+        self._refresh_button.pack(side=tk.RIGHT)
+        self._refresh_button.state(["disabled"])  # Enabled once there is a loader to rerun
+
+    def _render_location(self):
+        location = self.data['location']
+        city = location['city'] if location else "Locating…"
+        self._location_label.configure(text=f"🌍 {city}")
+        self._welcome_label.configure(
+            text=f"Welcome to {location['city']}!" if location else "Welcome!"
+        )
+
     def _create_enhanced_weather_display(self, parent):
-        """Create the weather display panel"""
+        """Create the container for the weather panel"""
+        self._weather_container = ttk.Frame(parent)
+        self._weather_container.pack(fill=tk.X, pady=10)
+
+    def _render_weather(self):
+        """Render the weather panel, or its loading state"""
+        weather = self.data['weather']
+        if weather and self._weather_widgets:
+            self._update_weather(weather)
+            return
+
+        self._clear(self._weather_container)
+        self._weather_widgets = None
+        if not weather:
+            self._loading_label(
+                self._weather_container,
+                "Loading weather…" if self.data['weather'] is None else "Weather data unavailable"
+            )
+            return
+
         theme = self.THEMES[self.theme]
         weather_frame = tk.Frame(
-            parent, 
+            self._weather_container,
             background=theme["accent"],
             highlightthickness=1,
             highlightbackground=theme["secondary"]
         )
-        weather_frame.pack(fill=tk.X, pady=10)
-        
-        # Weather icon
-        try:
-            icon_url = f"https://openweathermap.org/img/wn/{self.data['weather']['icon']}@2x.png"
-            icon_data = requests.get(icon_url).content
-            icon_img = Image.open(io.BytesIO(icon_data))
-            icon_img = icon_img.resize((100, 100), Image.Resampling.LANCZOS)
-            icon_photo = ImageTk.PhotoImage(icon_img)
-            
-            icon_label = tk.Label(weather_frame, image=icon_photo, background=theme["accent"])
-            icon_label.image = icon_photo
-            icon_label.pack(side=tk.LEFT, padx=15, pady=10)
-        except Exception:
-            icon_label = tk.Label(
-                weather_frame, 
-                text="☁️", 
-                font=("Segoe UI", 36),
-                background=theme["accent"],
-                foreground="#ffffff"
-            )
-            icon_label.pack(side=tk.LEFT, padx=15, pady=10)
-        
+        weather_frame.pack(fill=tk.X)
+
+        # Weather icon: show a placeholder now and swap in the image once it loads
+        icon_label = tk.Label(
+            weather_frame,
+            text="☁️",
+            font=("Segoe UI", 36),
+            background=theme["accent"],
+            foreground="#ffffff"
+        )
+        icon_label.pack(side=tk.LEFT, padx=15, pady=10)
+        self._load_weather_icon(icon_label, weather.get('icon'))
+
         # Weather info
         info_frame = tk.Frame(weather_frame, background=theme["accent"])
         info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        tk.Label(
+
+        summary_label = tk.Label(
             info_frame,
-            text=f"{self.data['weather']['temp']}°C | {self.data['weather']['description'].capitalize()}",
             font=('Segoe UI', 14),
             background=theme["accent"],
             foreground="#ffffff"
-        ).pack(anchor=tk.W)
-        
+        )
+        summary_label.pack(anchor=tk.W)
+
         # Weather details
         details_frame = tk.Frame(weather_frame, background=theme["accent"])
         details_frame.pack(side=tk.RIGHT, padx=15, pady=10)
-        
-        for detail in [
-            f"💧 Humidity: {self.data['weather']['humidity']}%",
-            f"💨 Wind: {self.data['weather']['wind_speed']} m/s"
-        ]:
-            tk.Label(
+
+        detail_labels = []
+        for _ in range(2):
+            label = tk.Label(
                 details_frame,
-                text=detail,
                 font=('Segoe UI', 11),
                 background=theme["accent"],
                 foreground="#ffffff",
                 anchor=tk.W
-            ).pack(pady=2)
-    
+            )
+            label.pack(pady=2)
+            detail_labels.append(label)
+
+        self._weather_widgets = {
+            'icon': icon_label,
+            'icon_code': weather.get('icon'),
+            'summary': summary_label,
+            'humidity': detail_labels[0],
+            'wind': detail_labels[1]
+        }
+        self._update_weather(weather)
+
+    def _update_weather(self, weather: Dict[str, Any]):
+        """Update the weather panel's labels in place"""
+        widgets = self._weather_widgets
+        widgets['summary'].configure(text=f"{weather['temp']}°C | {weather['description'].capitalize()}")
+        widgets['humidity'].configure(text=f"💧 Humidity: {weather['humidity']}%")
+        widgets['wind'].configure(text=f"💨 Wind: {weather['wind_speed']} m/s")
+        if weather.get('icon') != widgets['icon_code']:
+            widgets['icon_code'] = weather.get('icon')
+            self._load_weather_icon(widgets['icon'], widgets['icon_code'])
+
+    def _load_weather_icon(self, icon_label, icon_code):
+        if icon_code:
+            self._run_in_background(
+                lambda: icon_cache.load(icon_code),
+                lambda image: self._show_weather_icon(icon_label, image)
+            )
+
+    def _show_weather_icon(self, icon_label, image):
+        """Replace the placeholder with the loaded icon (called on the Tk thread)"""
+        if image is None or not icon_label.winfo_exists():
+            return
+        icon_photo = ImageTk.PhotoImage(image)
+        icon_label.configure(image=icon_photo, text="", width=image.width, height=image.height)
+        icon_label.image = icon_photo
+
     def _create_home_tab(self, parent):
         """Create the home tab with overview content"""
         theme = self.THEMES[self.theme]
-        
+
         # Scrollable frame setup
         canvas = tk.Canvas(parent, background=theme["bg"])
         scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
         scroll_frame = ttk.Frame(canvas)
-        
+
         scroll_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
         canvas.create_window((0, 0), window=scroll_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
-        
+
         # Welcome header
-        ttk.Label(
+        self._welcome_label = ttk.Label(
             scroll_frame,
-            text=f"Welcome to {self.data['location']['city']}!",
             font=('Segoe UI', 16, 'bold'),
             padding="0 10"
-        ).pack(anchor=tk.W, fill=tk.X)
-        
+        )
+        self._welcome_label.pack(anchor=tk.W, fill=tk.X)
+
         ttk.Separator(scroll_frame, orient='horizontal').pack(fill=tk.X, pady=10)
-        
+
         # Activity suggestions
         ttk.Label(
             scroll_frame,
@@ -215,10 +432,33 @@ class CulturalWeatherGUI:
             font=('Segoe UI', 14, 'bold'),
             padding="0 5"
         ).pack(anchor=tk.W, fill=tk.X)
-        
-        suggestion_frame = ttk.Frame(scroll_frame)
-        suggestion_frame.pack(fill=tk.X, pady=10)
-        
+
+        self._suggestion_frame = ttk.Frame(scroll_frame)
+        self._suggestion_frame.pack(fill=tk.X, pady=10)
+
+        # Highlights section
+        ttk.Label(
+            scroll_frame,
+            text="Highlights",
+            font=('Segoe UI', 14, 'bold'),
+            padding="0 15 0 5"
+        ).pack(anchor=tk.W, fill=tk.X)
+
+        self._highlights_frame = ttk.Frame(scroll_frame)
+        self._highlights_frame.pack(fill=tk.X, pady=5)
+
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+    def _render_suggestions(self):
+        """Render the suggestion cards, or their loading state"""
+        suggestion_frame = self._suggestion_frame
+        self._clear(suggestion_frame)
+        if self.data['suggestions'] is None:
+            self._loading_label(suggestion_frame, "Finding things to do…")
+            return
+
+        theme = self.THEMES[self.theme]
         for idx, suggestion in enumerate(self.data['suggestions'][:3]):
             card = tk.Frame(
                 suggestion_frame,
@@ -229,18 +469,18 @@ class CulturalWeatherGUI:
                 relief=tk.RAISED
             )
             card.grid(row=0, column=idx, padx=5, sticky="nsew")
-            
+
             icon = "🎭" if "museum" in suggestion.lower() else (
                   "🏞️" if "park" in suggestion.lower() else (
                   "🍽️" if "dining" in suggestion.lower() else "✨"))
-            
+
             tk.Label(
                 card,
                 text=icon,
                 font=('Segoe UI', 24),
                 background=theme["secondary"]
             ).pack()
-            
+
             tk.Label(
                 card,
                 text=suggestion,
@@ -248,205 +488,208 @@ class CulturalWeatherGUI:
                 wraplength=200,
                 background=theme["secondary"]
             ).pack(pady=5)
-            
+
             suggestion_frame.grid_columnconfigure(idx, weight=1)
-        
-        # Highlights section
-        ttk.Label(
-            scroll_frame,
-            text="Highlights",
-            font=('Segoe UI', 14, 'bold'),
-            padding="0 15 0 5"
-        ).pack(anchor=tk.W, fill=tk.X)
-        
-        highlights_frame = ttk.Frame(scroll_frame)
-        highlights_frame.pack(fill=tk.X, pady=5)
-        
+
+    def _render_highlights(self):
+        """Render the top event and attraction, or the loading state"""
+        highlights_frame = self._highlights_frame
+        self._clear(highlights_frame)
+
         if self.data['events']:
             event = self.data['events'][0]
             self._create_highlight_item(
-                highlights_frame, 
+                highlights_frame,
                 title=event['title'],
                 subtitle=f"📅 {event['date']} at {event['venue']}",
                 icon="🎭"
             ).pack(fill=tk.X, pady=5)
-        
+
         if self.data['attractions']:
             attr = self.data['attractions'][0]
             self._create_highlight_item(
-                highlights_frame, 
+                highlights_frame,
                 title=attr.get('name', 'Local Attraction'),
                 subtitle=attr.get('kinds', '').replace(',', ', ').title(),
                 icon="🏛️"
             ).pack(fill=tk.X, pady=5)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-    
+
+        if self.data['events'] is None or self.data['attractions'] is None:
+            self._loading_label(highlights_frame, "Loading highlights…")
+
     def _create_events_tab(self, parent):
         """Create the events tab"""
-        theme = self.THEMES[self.theme]
-        
         ttk.Label(
             parent,
             text="Upcoming Events",
             font=('Segoe UI', 14, 'bold'),
             padding="10"
         ).pack(anchor=tk.W)
-        
-        # Scrollable events area
-        canvas = tk.Canvas(parent, background=theme["bg"])
-        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
-        scroll_frame = ttk.Frame(canvas)
-        
-        scroll_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-        canvas.create_window((0, 0), window=scroll_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        if not self.data['events']:
-            ttk.Label(
-                scroll_frame,
-                text="No events found for this location",
-                font=('Segoe UI', 11, 'italic'),
-                padding="20"
-            ).pack()
-        else:
-            for event in self.data['events']:
-                event_card = tk.Frame(
-                    scroll_frame,
-                    background=theme["secondary"],
-                    padx=15,
-                    pady=15,
-                    bd=1,
-                    relief=tk.RAISED
-                )
-                event_card.pack(fill=tk.X, padx=10, pady=5)
-                
-                tk.Label(
-                    event_card,
-                    text=event['title'],
-                    font=('Segoe UI', 12, 'bold'),
-                    anchor=tk.W,
-                    justify=tk.LEFT,
-                    background=theme["secondary"]
-                ).pack(anchor=tk.W)
-                
-                details_frame = tk.Frame(event_card, background=theme["secondary"])
-                details_frame.pack(fill=tk.X, pady=(5, 0), anchor=tk.W)
-                
-                tk.Label(
-                    details_frame,
-                    text=f"📅 {event['date']}",
-                    font=('Segoe UI', 10),
-                    background=theme["secondary"]
-                ).pack(side=tk.LEFT, padx=(0, 15))
-                
-                tk.Label(
-                    details_frame,
-                    text=f"📍 {event['venue']}",
-                    font=('Segoe UI', 10),
-                    background=theme["secondary"]
-                ).pack(side=tk.LEFT)
-                
-                ttk.Button(
-                    event_card,
-                    text="Get Tickets",
-                    command=lambda url=event['url']: webbrowser.open(url)
-                ).pack(anchor=tk.E, pady=(10, 0))
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-    
+
+        self._events_status = ttk.Label(parent, font=('Segoe UI', 11, 'italic'), padding="20")
+        self._events_list = VirtualList(
+            parent,
+            row_height=120,
+            create_row=self._create_event_row,
+            update_row=self._update_event_row,
+            on_need_more=lambda: self._load_more('events'),
+            background=self.THEMES[self.theme]["bg"]
+        )
+        self._events_list.pack(fill=tk.BOTH, expand=True)
+
+    def _render_events(self):
+        """Show the event list, or its loading/empty state"""
+        events = self.data['events']
+        self._show_list_status(
+            self._events_status, self._events_list,
+            "Loading events…" if events is None else
+            "No events found for this location" if not events else None
+        )
+        self._events_list.set_items(events or [])
+
+    def _create_event_row(self, parent):
+        theme = self.THEMES[self.theme]
+        card = tk.Frame(
+            parent,
+            background=theme["secondary"],
+            padx=15,
+            pady=10,
+            bd=1,
+            relief=tk.RAISED
+        )
+        card.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        row = {
+            'title': tk.Label(
+                card,
+                font=('Segoe UI', 12, 'bold'),
+                anchor=tk.W,
+                justify=tk.LEFT,
+                background=theme["secondary"]
+            )
+        }
+        row['title'].pack(anchor=tk.W)
+
+        details_frame = tk.Frame(card, background=theme["secondary"])
+        details_frame.pack(fill=tk.X, pady=(5, 0), anchor=tk.W)
+
+        row['date'] = tk.Label(details_frame, font=('Segoe UI', 10), background=theme["secondary"])
+        row['date'].pack(side=tk.LEFT, padx=(0, 15))
+        row['venue'] = tk.Label(details_frame, font=('Segoe UI', 10), background=theme["secondary"])
+        row['venue'].pack(side=tk.LEFT)
+
+        row['tickets'] = ttk.Button(card, text="Get Tickets")
+        row['tickets'].pack(anchor=tk.E)
+        return row
+
+    @staticmethod
+    def _update_event_row(row, event):
+        row['title'].configure(text=event['title'])
+        row['date'].configure(text=f"📅 {event['date']}")
+        row['venue'].configure(text=f"📍 {event['venue']}")
+        row['tickets'].configure(command=lambda url=event['url']: webbrowser.open(url))
+
     def _create_attractions_tab(self, parent):
         """Create the attractions tab"""
-        theme = self.THEMES[self.theme]
-        
         ttk.Label(
             parent,
             text="Local Attractions",
             font=('Segoe UI', 14, 'bold'),
             padding="10"
         ).pack(anchor=tk.W)
-        
-        # Scrollable area
-        canvas = tk.Canvas(parent, background=theme["bg"])
-        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
-        scroll_frame = ttk.Frame(canvas)
-        
-        scroll_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-        canvas.create_window((0, 0), window=scroll_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        if not self.data['attractions']:
-            ttk.Label(
-                scroll_frame,
-                text="No attractions found for this location",
-                font=('Segoe UI', 11, 'italic'),
-                padding="20"
-            ).pack()
+
+        self._attractions_status = ttk.Label(parent, font=('Segoe UI', 11, 'italic'), padding="20")
+        self._attractions_list = VirtualList(
+            parent,
+            row_height=140,
+            create_row=self._create_attraction_row,
+            update_row=self._update_attraction_row,
+            on_need_more=lambda: self._load_more('attractions'),
+            background=self.THEMES[self.theme]["bg"]
+        )
+        self._attractions_list.pack(fill=tk.BOTH, expand=True)
+
+    def _render_attractions(self):
+        """Show the attraction list, or its loading/empty state"""
+        attractions = self.data['attractions']
+        self._show_list_status(
+            self._attractions_status, self._attractions_list,
+            "Loading attractions…" if attractions is None else
+            "No attractions found for this location" if not attractions else None
+        )
+        self._attractions_list.set_items(attractions or [])
+
+    def _create_attraction_row(self, parent):
+        theme = self.THEMES[self.theme]
+        card = tk.Frame(
+            parent,
+            background=theme["secondary"],
+            padx=15,
+            pady=10,
+            bd=1,
+            relief=tk.RAISED
+        )
+        card.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        row = {}
+        for name, font, pady in (('name', ('Segoe UI', 12, 'bold'), 0),
+                                 ('kinds', ('Segoe UI', 9), (5, 0)),
+                                 ('description', ('Segoe UI', 10), (5, 0))):
+            row[name] = tk.Label(
+                card,
+                font=font,
+                anchor=tk.W,
+                justify=tk.LEFT,
+                wraplength=800,
+                background=theme["secondary"]
+            )
+            row[name].pack(anchor=tk.W, pady=pady)
+        return row
+
+    @staticmethod
+    def _update_attraction_row(row, attr):
+        row['name'].configure(text=attr.get('name', 'Local Attraction'))
+        row['kinds'].configure(text=attr.get('kinds', '').replace(',', ', ').title())
+
+        desc = attr.get('wikipedia_extracts', {}).get('text', '')
+        if len(desc) > 200:
+            desc = desc[:200] + "..."
+        row['description'].configure(text=desc)
+
+    def _show_list_status(self, status_label, virtual_list, text):
+        """Show `text` in place of a list, or the list itself when text is None"""
+        if text is None:
+            status_label.pack_forget()
         else:
-            grid_frame = ttk.Frame(scroll_frame)
-            grid_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-            
-            grid_frame.columnconfigure(0, weight=1)
-            grid_frame.columnconfigure(1, weight=1)
-            
-            for idx, attr in enumerate(self.data['attractions']):
-                row, col = divmod(idx, 2)
-                
-                card = tk.Frame(
-                    grid_frame,
-                    background=theme["secondary"],
-                    padx=15,
-                    pady=15,
-                    bd=1, 
-                    relief=tk.RAISED
-                )
-                card.grid(row=row, column=col, padx=5, pady=5, sticky="nsew")
-                
-                tk.Label(
-                    card,
-                    text=attr.get('name', 'Local Attraction'),
-                    font=('Segoe UI', 12, 'bold'),
-                    anchor=tk.W,
-                    justify=tk.LEFT,
-                    wraplength=350,
-                    background=theme["secondary"]
-                ).pack(anchor=tk.W)
-                
-                if 'kinds' in attr:
-                    kinds = attr['kinds'].replace(',', ', ').title()
-                    tk.Label(
-                        card,
-                        text=kinds,
-                        font=('Segoe UI', 9),
-                        anchor=tk.W,
-                        justify=tk.LEFT,
-                        background=theme["secondary"]
-                    ).pack(anchor=tk.W, pady=(5, 0))
-                
-                if 'wikipedia_extracts' in attr and 'text' in attr['wikipedia_extracts']:
-                    desc = attr['wikipedia_extracts']['text']
-                    if len(desc) > 200:
-                        desc = desc[:200] + "..."
-                    
-                    tk.Label(
-                        card,
-                        text=desc,
-                        font=('Segoe UI', 10),
-                        anchor=tk.W,
-                        justify=tk.LEFT,
-                        wraplength=350,
-                        background=theme["secondary"]
-                    ).pack(anchor=tk.W, pady=(10, 0))
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-    
+            status_label.configure(text=text)
+            status_label.pack(anchor=tk.W, before=virtual_list)
+
+    def _load_more(self, section: str):
+        """Fetch the next page of a list in the background and append it"""
+        items = self.data[section]
+        if not self._pager or not items or section in self._paging or section in self._exhausted:
+            return
+
+        self._paging.add(section)
+        pager, offset = self._pager, len(items)
+
+        def on_done(page):
+            self._paging.discard(section)
+            if self.data[section] is not items:
+                return  # The list was replaced while this page loaded
+            if not page:
+                self._exhausted.add(section)
+                return
+            self.data[section] = items + page
+            list_widget = self._events_list if section == 'events' else self._attractions_list
+            list_widget.extend(page)
+
+        self._run_in_background(lambda: pager(section, offset), on_done)
+
     def _create_highlight_item(self, parent, title: str, subtitle: str = None, icon: str = None):
         """Helper to create highlight items"""
         theme = self.THEMES[self.theme]
-        
+
         frame = tk.Frame(
             parent,
             background=theme["secondary"],
@@ -455,7 +698,7 @@ class CulturalWeatherGUI:
             bd=1,
             relief=tk.RAISED
         )
-        
+
         if icon:
             tk.Label(
                 frame,
@@ -463,10 +706,10 @@ class CulturalWeatherGUI:
                 font=('Segoe UI', 18),
                 background=theme["secondary"]
             ).pack(side=tk.LEFT, padx=(0, 10))
-        
+
         content_frame = tk.Frame(frame, background=theme["secondary"])
         content_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
+
         tk.Label(
             content_frame,
             text=title,
@@ -475,7 +718,7 @@ class CulturalWeatherGUI:
             justify=tk.LEFT,
             background=theme["secondary"]
         ).pack(anchor=tk.W)
-        
+
         if subtitle:
             tk.Label(
                 content_frame,
@@ -485,34 +728,51 @@ class CulturalWeatherGUI:
                 justify=tk.LEFT,
                 background=theme["secondary"]
             ).pack(anchor=tk.W)
-        
+
         return frame
-    
+
+    def _loading_label(self, parent, text: str):
+        """Helper to show a placeholder while a section's data is loading"""
+        label = ttk.Label(
+            parent,
+            text=text,
+            font=('Segoe UI', 11, 'italic'),
+            padding="20"
+        )
+        label.pack(anchor=tk.W)
+        return label
+
+    @staticmethod
+    def _clear(frame):
+        for child in frame.winfo_children():
+            child.destroy()
+
     def _create_status_bar(self, parent):
         """Create the status bar at bottom"""
         theme = self.THEMES[self.theme]
-        
+
         frame = tk.Frame(
             parent,
             background=theme["secondary"],
             height=25
         )
         frame.pack(fill=tk.X, side=tk.BOTTOM)
-        
-        tk.Label(
+
+        self._status_label = tk.Label(
             frame,
             text=f"Data last updated: {time.strftime('%H:%M:%S')}",
             font=('Segoe UI', 8),
             background=theme["secondary"]
-        ).pack(side=tk.LEFT, padx=10)
-        
+        )
+        self._status_label.pack(side=tk.LEFT, padx=10)
+
         tk.Label(
             frame,
             text="v2.0 Professional",
             font=('Segoe UI', 8),
             background=theme["secondary"]
         ).pack(side=tk.RIGHT, padx=10)
-    
+
     def run(self):
         """Run the GUI main loop"""
-        self.root.mainloop()
\ No newline at end of file
+        self.root.mainloop()
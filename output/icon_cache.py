@@ -0,0 +1,81 @@
+import io
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+from config import Config
+
+ICON_URL = "https://openweathermap.org/img/wn/{}@2x.png"
+ICON_SIZE = (100, 100)
+
+# OpenWeather's full icon set: condition groups, each in a day and night variant
+ICON_CODES = [
+    f"{group}{time_of_day}"
+    for group in ('01', '02', '03', '04', '09', '10', '11', '13', '50')
+    for time_of_day in ('d', 'n')
+]
+
+class IconCache:
+    """Weather icons stored on disk already resized, keyed by OpenWeather icon code"""
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    def path(self, code):
+        if not code.isalnum():
+            raise ValueError(f"Invalid icon code: {code!r}")
+        return os.path.join(self.cache_dir, f"{code}.png")
+
+    def load(self, code):
+        """Return the icon as a PIL image, downloading and resizing it on first use.
+
+        Safe to call from a worker thread; it does no Tk work.
+        """
+        path = self.path(code)
+        if not os.path.exists(path):
+            self._download(code, path)
+        with Image.open(path) as image:
+            image.load()
+            return image
+
+    def prewarm(self, codes=ICON_CODES, workers=6):
+        """Download every missing icon; the set is small and fixed"""
+        missing = [code for code in codes if not os.path.exists(self.path(code))]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for code, error in zip(missing, executor.map(self._try_download, missing)):
+                if error:
+                    print(f"Icon {code}: {error}")
+        return len(missing)
+
+    def _try_download(self, code):
+        try:
+            self._download(code, self.path(code))
+        except Exception as e:
+            return e
+        return None
+
+    def _download(self, code, path):
+        from api_clients import session
+
+        response = session.get(ICON_URL.format(code))
+        response.raise_for_status()
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                with Image.open(io.BytesIO(response.content)) as image:
+                    image.convert('RGBA').resize(ICON_SIZE, Image.Resampling.LANCZOS).save(f, format='PNG')
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+icon_cache = IconCache(Config.ICON_CACHE_DIR)
+
+if __name__ == "__main__":
+    downloaded = icon_cache.prewarm()
+    print(f"Icon cache ready in {icon_cache.cache_dir} ({downloaded} downloaded)")
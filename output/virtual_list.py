@@ -0,0 +1,115 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, Callable, List, Optional
+
+class VirtualList(ttk.Frame):
+    """Scrollable list of fixed-height rows that only builds widgets for visible rows.
+
+    `create_row(parent)` builds one row's widgets and returns an object that
+    `update_row(row, item)` later fills with an item's data. Rows are created
+    once for the visible window and recycled as the list scrolls, so memory
+    and layout cost don't grow with the number of items. When the view gets
+    within `prefetch` rows of the end, `on_need_more()` is called so the
+    owner can append the next page with `extend`.
+    """
+
+    def __init__(self, parent, row_height: int,
+                 create_row: Callable[[tk.Widget], Any],
+                 update_row: Callable[[Any, Any], None],
+                 on_need_more: Optional[Callable[[], None]] = None,
+                 prefetch: int = 5, background: str = None):
+        super().__init__(parent)
+        self.row_height = row_height
+        self.create_row = create_row
+        self.update_row = update_row
+        self.on_need_more = on_need_more
+        self.prefetch = prefetch
+        self.items: List[Any] = []
+        self._rows = []  # (canvas window id, row frame, row object, index shown)
+
+        self.canvas = tk.Canvas(self, background=background, highlightthickness=0)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._yview)
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.canvas.bind("<Configure>", lambda e: self._layout())
+        self._bind_wheel(self.canvas)
+
+    def set_items(self, items: List[Any]):
+        """Replace the list's contents and scroll back to the top"""
+        self.items = list(items)
+        self.canvas.yview_moveto(0)
+        self._layout(force=True)
+
+    def extend(self, items: List[Any]):
+        """Append items, e.g. a freshly loaded page, keeping the scroll position"""
+        self.items.extend(items)
+        self._layout(force=True)
+
+    def _yview(self, *args):
+        self.canvas.yview(*args)
+        self._refresh()
+
+    def _on_wheel(self, event):
+        if event.num == 4:
+            delta = -1
+        elif event.num == 5:
+            delta = 1
+        else:
+            delta = -1 if event.delta > 0 else 1
+        self.canvas.yview_scroll(delta, "units")
+        self._refresh()
+
+    def _bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", self._on_wheel)
+        widget.bind("<Button-4>", self._on_wheel)
+        widget.bind("<Button-5>", self._on_wheel)
+        for child in widget.winfo_children():
+            self._bind_wheel(child)
+
+    def _layout(self, force: bool = False):
+        """Size the scroll region and the row pool to the current items and viewport"""
+        width = self.canvas.winfo_width()
+        total_height = len(self.items) * self.row_height
+        self.canvas.configure(
+            scrollregion=(0, 0, width, max(total_height, self.canvas.winfo_height())),
+            yscrollincrement=self.row_height
+        )
+
+        # One extra row covers the partly visible row at the bottom
+        needed = self.canvas.winfo_height() // self.row_height + 2
+        while len(self._rows) < needed:
+            frame = ttk.Frame(self.canvas, height=self.row_height)
+            frame.pack_propagate(False)
+            row = self.create_row(frame)
+            self._bind_wheel(frame)
+            window = self.canvas.create_window(0, 0, window=frame, anchor="nw",
+                                               height=self.row_height, state="hidden")
+            self._rows.append([window, frame, row, None])
+
+        for entry in self._rows:
+            self.canvas.itemconfigure(entry[0], width=width)
+            if force:
+                entry[3] = None
+        self._refresh()
+
+    def _refresh(self):
+        """Point each pooled row at the item now under it"""
+        first = max(0, int(self.canvas.canvasy(0)) // self.row_height)
+        for offset, entry in enumerate(self._rows):
+            window, _, row, shown = entry
+            index = first + offset
+            if index >= len(self.items):
+                self.canvas.itemconfigure(window, state="hidden")
+                entry[3] = None
+                continue
+            self.canvas.coords(window, 0, index * self.row_height)
+            self.canvas.itemconfigure(window, state="normal")
+            if shown != index:
+                self.update_row(row, self.items[index])
+                entry[3] = index
+
+        last_visible = first + len(self._rows)
+        if self.on_need_more and last_visible + self.prefetch >= len(self.items):
+            self.on_need_more()
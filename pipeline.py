@@ -0,0 +1,210 @@
+from functools import cached_property
+import api_clients
+from data_processing import WeatherAnalyzer, CulturalMatcher
+from utils.fanout import fetch_all, fetch_all_async
+from utils.metrics import metrics
+from config import Config
+
+class Clients:
+    """The set of API clients shared by every location explored in a process.
+
+    Each client (and its module) is created on first use, so e.g. a run with
+    --location never builds the IP geolocation client.
+    """
+
+    @cached_property
+    def geo(self):
+        return api_clients.GeolocationClient()
+
+    @cached_property
+    def geocode(self):
+        return api_clients.GeocodingClient()
+
+    @cached_property
+    def weather(self):
+        return api_clients.WeatherClient()
+
+    @cached_property
+    def events(self):
+        return api_clients.EventsClient()
+
+    @cached_property
+    def attractions(self):
+        return api_clients.AttractionsClient()
+
+    @cached_property
+    def countries(self):
+        return api_clients.CountriesClient()
+
+def resolve_location(clients, query=None):
+    """Geocode `query`, or locate the caller by IP when no query is given"""
+    with metrics.span('geocode'):
+        if query:
+            return clients.geocode.get_coordinates(query)
+        return clients.geo.get_location()
+
+def fetch_data(clients, location_data, on_result=None):
+    """Fetch all provider data concurrently; each provider falls back on error or timeout"""
+    lat, lon = location_data['lat'], location_data['lon']
+    country_code = location_data.get('countryCode', 'us')
+    return fetch_all({
+        'weather': (lambda: clients.weather.get_weather(lat, lon), None),
+        'events': (lambda: _get_events(clients, location_data), []),
+        'attractions': (lambda: clients.attractions.get_attractions(lat, lon), []),
+        'country': (lambda: clients.countries.get_country_info(country_code), None)
+    }, timeouts=Config.PROVIDER_TIMEOUTS, on_result=on_result)
+
+def _get_events(clients, location_data, size=5):
+    """First events for a city, or around the coordinates of a location without one"""
+    return list(_iter_events(clients, location_data, max_events=size, page_size=size))
+
+def _iter_events(clients, location_data, **options):
+    """`EventsClient.iter_events` for the same query the first page used"""
+    country_code = location_data.get('countryCode', 'us')
+    if location_data.get('city'):
+        return clients.events.iter_events(location_data['city'], country_code, **options)
+    return clients.events.iter_events(
+        country_code=country_code, lat=location_data['lat'], lon=location_data['lon'], **options
+    )
+
+def _location_output(location_data, country):
+    return {
+        'city': location_data['city'],
+        'country': country['name']['common'] if country else 'Unknown'
+    }
+
+def suggest(data):
+    """Categorize the weather and match activity suggestions to it.
+
+    Returns no suggestions when the weather fetch failed or timed out.
+    """
+    if not data['weather']:
+        return []
+    with metrics.span('analyze'):
+        weather_cat = WeatherAnalyzer.get_weather_category(data['weather'])
+    with metrics.span('match'):
+        return CulturalMatcher.generate_suggestions(
+            weather_cat,
+            data['attractions'],
+            data['events']
+        )
+
+def build_output(location_data, data):
+    """Analyze fetched data and assemble the output dict consumed by the outputs"""
+    suggestions = suggest(data)
+
+    return {
+        'location': _location_output(location_data, data['country']),
+        'weather': data['weather'],
+        'events': data['events'],
+        'attractions': data['attractions'],
+        'suggestions': suggestions
+    }
+
+def explore(clients, location_data):
+    """Run the fetch → analyze → match pipeline for a resolved location"""
+    return build_output(location_data, fetch_data(clients, location_data))
+
+def load_more(clients, location_data, section, offset):
+    """Return the next Config.LIST_PAGE_SIZE 'events' or 'attractions' after `offset`.
+
+    Returns an empty list once the provider has nothing more (or won't page
+    any deeper). Pages are cached like the first one.
+    """
+    page_size = Config.LIST_PAGE_SIZE
+    if section == 'events':
+        return list(_iter_events(
+            clients, location_data, max_events=page_size, page_size=page_size, offset=offset
+        ))
+    if section == 'attractions':
+        if offset >= Config.ATTRACTIONS_MAX_RESULTS:
+            return []
+        # OpenTripMap has no offset, so ask for a longer list; details are cached per place
+        limit = min(offset + page_size, Config.ATTRACTIONS_MAX_RESULTS)
+        attractions = clients.attractions.get_attractions(
+            location_data['lat'], location_data['lon'], limit=limit
+        )
+        return attractions[offset:]
+    raise ValueError(f"Unknown section: {section}")
+
+def explore_progressively(clients, query, publish):
+    """Explore a location, calling `publish(section, value)` as each part is ready.
+
+    Sections are the keys of `build_output`'s dict: 'location' first, then
+    'weather', 'events' and 'attractions' in whatever order their providers
+    answer, and 'suggestions' once everything is in. 'pager' carries a
+    `load_more(section, offset)` function bound to the location, for lists
+    that page further on demand. Publishes 'error' instead if the location
+    can't be resolved.
+    """
+    location_data = resolve_location(clients, query)
+    if not location_data:
+        publish('error', "Error: Could not determine location")
+        return
+    publish('location', _location_output(location_data, None))
+    publish('pager', lambda section, offset: load_more(clients, location_data, section, offset))
+
+    def on_result(name, value):
+        if name == 'country':
+            if value:
+                publish('location', _location_output(location_data, value))
+        else:
+            # Failed providers publish their fallback so the GUI stops showing "loading"
+            publish(name, value if value is not None else False)
+
+    data = fetch_data(clients, location_data, on_result=on_result)
+    publish('suggestions', suggest(data))
+
+class AsyncClients:
+    """Async counterparts of `Clients`, for driving the pipeline on one event loop"""
+
+    def __init__(self):
+        # Imported here so synchronous runs never load aiohttp
+        from api_clients import aio
+
+        self.geo = aio.AsyncGeolocationClient()
+        self.geocode = aio.AsyncGeocodingClient()
+        self.weather = aio.AsyncWeatherClient()
+        self.events = aio.AsyncEventsClient()
+        self.attractions = aio.AsyncAttractionsClient()
+        self.countries = aio.AsyncCountriesClient()
+        self.close = aio.close_session
+
+async def resolve_location_async(clients, query=None):
+    with metrics.span('geocode'):
+        if query:
+            return await clients.geocode.get_coordinates(query)
+        return await clients.geo.get_location()
+
+async def fetch_data_async(clients, location_data):
+    lat, lon = location_data['lat'], location_data['lon']
+    country_code = location_data.get('countryCode', 'us')
+    return await fetch_all_async({
+        'weather': (lambda: clients.weather.get_weather(lat, lon), None),
+        'events': (lambda: _get_events_async(clients, location_data), []),
+        'attractions': (lambda: clients.attractions.get_attractions(lat, lon), []),
+        'country': (lambda: clients.countries.get_country_info(country_code), None)
+    }, timeouts=Config.PROVIDER_TIMEOUTS)
+
+async def _get_events_async(clients, location_data, size=5):
+    country_code = location_data.get('countryCode', 'us')
+    if location_data.get('city'):
+        return await clients.events.get_events(location_data['city'], country_code)
+    return [event async for event in clients.events.iter_events(
+        country_code=country_code, lat=location_data['lat'], lon=location_data['lon'],
+        max_events=size, page_size=size
+    )]
+
+async def explore_async(clients, location_data):
+    return build_output(location_data, await fetch_data_async(clients, location_data))
+
+async def run_async(query=None):
+    """Resolve and explore one location on the running loop, or return None if it can't be found"""
+    clients = AsyncClients()
+    try:
+        location_data = await resolve_location_async(clients, query)
+        if not location_data:
+            return None
+        return await explore_async(clients, location_data)
+    finally:
+        await clients.close()
@@ -0,0 +1,123 @@
+import json
+import math
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import urlparse, parse_qs
+from pipeline import resolve_location, explore
+from utils.cache import memory_cache
+from api_clients import scheduler
+from utils.metrics import metrics
+
+class ExplorerRequestHandler(BaseHTTPRequestHandler):
+    """Serves the explore pipeline as JSON.
+
+    GET /explore?location=Paris
+    GET /explore?lat=48.85&lon=2.35&country=FR[&city=Paris]
+    GET /health
+    GET /metrics (Prometheus text; enable with METRICS_ENABLED=1 or --metrics-out)
+    """
+
+    server_version = "CulturalWeatherExplorer/1.0"
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        try:
+            if url.path == '/explore':
+                self._explore(params)
+            elif url.path == '/health':
+                self._send_json(200, {
+                    'status': 'ok',
+                    'memory_cache_entries': len(memory_cache),
+                    'rate_limits': scheduler.stats()
+                })
+            elif url.path == '/metrics':
+                self._send_text(200, metrics.to_prometheus())
+            else:
+                self._send_json(404, {'error': f"Unknown path: {url.path}"})
+        except Exception as e:
+            self._send_json(500, {'error': f"{type(e).__name__}: {e}"})
+
+    def _explore(self, params):
+        if 'lat' in params and 'lon' in params:
+            if not params.get('country'):
+                return self._send_json(400, {'error': "Pass country with lat and lon"})
+            try:
+                # Without a city, events are searched around the coordinates
+                location_data = {
+                    'city': params.get('city'),
+                    'lat': float(params['lat']),
+                    'lon': float(params['lon']),
+                    'countryCode': params['country']
+                }
+            except ValueError:
+                return self._send_json(400, {'error': "lat and lon must be numbers"})
+            if not _valid_coordinates(location_data['lat'], location_data['lon']):
+                return self._send_json(400, {'error': "lat must be within -90..90 and lon within -180..180"})
+        elif params.get('location'):
+            location_data = resolve_location(self.server.clients, params['location'])
+            if not location_data:
+                return self._send_json(404, {'error': "Could not determine location"})
+        else:
+            return self._send_json(400, {'error': "Pass either location or lat and lon"})
+
+        self._send_json(200, explore(self.server.clients, location_data))
+
+    def _send_json(self, status, payload):
+        self._send(status, json.dumps(payload, ensure_ascii=False), 'application/json')
+
+    def _send_text(self, status, text):
+        self._send(status, text, 'text/plain; version=0.0.4')
+
+    def _send(self, status, text, content_type):
+        body = text.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', f'{content_type}; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+def _valid_coordinates(lat, lon):
+    # float() also parses 'nan' and 'inf'
+    return (math.isfinite(lat) and math.isfinite(lon)
+            and -90 <= lat <= 90 and -180 <= lon <= 180)
+
+class ExplorerServer(HTTPServer):
+    """Long-running HTTP server that keeps clients, connection pools and caches warm.
+
+    Requests are handled on a bounded worker pool rather than a thread per
+    connection, so bursts queue instead of exhausting the process.
+    """
+
+    request_queue_size = 128  # Let connection bursts wait in the listen backlog
+
+    def __init__(self, address, clients, workers):
+        super().__init__(address, ExplorerRequestHandler)
+        self.clients = clients
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="serve")
+
+    def process_request(self, request, client_address):
+        self._executor.submit(self._handle, request, client_address)
+
+    def _handle(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+def serve(clients, host, port, workers):
+    server = ExplorerServer((host, port), clients, workers)
+    print(f"Serving on http://{host}:{server.server_address[1]} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
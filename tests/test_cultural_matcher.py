@@ -0,0 +1,34 @@
+from data_processing import CulturalMatcher
+
+PARK = {'name': "Central Park", 'kinds': "gardens_and_parks,natural"}
+BEACH = {'name': "Beach X", 'kinds': "beaches"}
+MUSEUM = {'name': "City Museum", 'kinds': "museums,cultural"}
+
+def test_unsuitable_outdoor_places_do_not_take_reserved_slots():
+    suggestions = CulturalMatcher.generate_suggestions(('freezing', 'snowy'), [PARK, BEACH], [])
+
+    assert "Explore Central Park" not in suggestions
+    assert "Relax at Beach X" not in suggestions
+    assert len(suggestions) == CulturalMatcher.LIMIT
+
+def test_suitable_places_keep_their_slots():
+    suggestions = CulturalMatcher.generate_suggestions(('warm', 'clear'), [PARK, BEACH], [])
+
+    assert "Explore Central Park" in suggestions
+    assert "Relax at Beach X" in suggestions
+
+def test_weather_suggestions_survive_many_matches():
+    attractions = [dict(MUSEUM, name=f"City Museum {i}") for i in range(10)]
+    events = [{'title': f"Concert {i}", 'category': "Music"} for i in range(10)]
+    suggestions = CulturalMatcher.generate_suggestions(('cool', 'cloudy'), attractions, events)
+
+    weather = set(CulturalMatcher.SUGGESTIONS['temperature']['cool']
+                  + CulturalMatcher.SUGGESTIONS['condition']['cloudy'])
+    assert len(weather.intersection(suggestions)) == CulturalMatcher.SLOTS['weather']
+
+def test_ranking_is_stable_and_matches_batch():
+    args = (('cold', 'rainy'), [MUSEUM, PARK], [{'title': "Concert", 'category': "Music"}])
+    single = CulturalMatcher.generate_suggestions(*args)
+
+    assert single == CulturalMatcher.generate_suggestions(*args)
+    assert CulturalMatcher.generate_suggestions_batch([args, args]) == [single, single]
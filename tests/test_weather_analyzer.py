@@ -0,0 +1,33 @@
+import pytest
+from data_processing import WeatherAnalyzer
+
+# Bin edges, both sides of them, and every OpenWeather condition group
+TEMPS = [-20.0, -0.1, 0.0, 9.9, 10.0, 19.9, 20.0, 29.9, 30.0, 45.0]
+CONDITION_IDS = [200, 232, 300, 500, 531, 600, 622, 701, 781, 800, 801, 804, 900, -1]
+
+def test_condition_ids_match_condition_names():
+    names = {200: 'Thunderstorm', 300: 'Drizzle', 500: 'Rain', 600: 'Snow',
+             701: 'Mist', 800: 'Clear', 803: 'Clouds'}
+    for condition_id, conditions in names.items():
+        weather = {'temp': 15, 'conditions': conditions}
+        assert (WeatherAnalyzer.get_weather_category(dict(weather, condition_id=condition_id))
+                == WeatherAnalyzer.get_weather_category(weather))
+
+def test_batch_matches_scalar_categorization():
+    np = pytest.importorskip("numpy")
+    temps = [temp for temp in TEMPS for _ in CONDITION_IDS]
+    ids = [condition_id for _ in TEMPS for condition_id in CONDITION_IDS]
+
+    temp_cats, cond_cats = WeatherAnalyzer.categorize_batch(temps, ids)
+
+    expected = [
+        WeatherAnalyzer.get_weather_category({'temp': temp, 'condition_id': condition_id})
+        for temp, condition_id in zip(temps, ids)
+    ]
+    assert list(zip(temp_cats.tolist(), cond_cats.tolist())) == expected
+    assert isinstance(temp_cats, np.ndarray)
+
+def test_batch_rejects_mismatched_lengths():
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        WeatherAnalyzer.categorize_batch([1.0, 2.0], [800])
@@ -0,0 +1,116 @@
+import time
+import asyncio
+import weakref
+from functools import wraps
+from config import Config
+from utils.metrics import metrics
+from utils.cache import (
+    memory_cache,
+    in_background_refresh,
+    _lookup,
+    _store,
+    _make_key,
+    _refreshing,
+    _refreshing_lock
+)
+
+_async_inflight = weakref.WeakKeyDictionary()  # event loop -> {cache_key: Future}
+_async_refreshes = set()
+
+async def _lookup_async(cache_key, expires_after):
+    # Memory hits are answered on the loop; only backend reads go to a worker thread
+    if Config.CACHE_MEMORY_ENABLED:
+        entry = memory_cache.get(cache_key)
+        if entry is not None:
+            return entry
+    return await asyncio.to_thread(_lookup, cache_key, expires_after)
+
+async def _single_flight_async(cache_key, fetch):
+    """Await `fetch()` once for all concurrent callers of `cache_key` on this loop.
+
+    The fetch runs in its own task, so a caller that is cancelled (e.g. by a
+    timeout) does not cancel the fetch for the callers still waiting on it.
+    """
+    loop = asyncio.get_running_loop()
+    inflight = _async_inflight.setdefault(loop, {})
+    task = inflight.get(cache_key)
+    if task is None:
+        task = inflight[cache_key] = loop.create_task(fetch())
+
+        def finished(task):
+            inflight.pop(cache_key, None)
+            if not task.cancelled():
+                task.exception()  # Mark as retrieved even if every caller gave up
+
+        task.add_done_callback(finished)
+    return await asyncio.shield(task)
+
+def _refresh_in_background_async(cache_key, func, args, kwargs, expires_after):
+    """Recompute a stale entry in a task on the running loop, at most once per key at a time"""
+    with _refreshing_lock:
+        if cache_key in _refreshing:
+            return
+        _refreshing.add(cache_key)
+
+    async def load():
+        result = await func(*args, **kwargs)
+        if result is not None:
+            await asyncio.to_thread(_store, cache_key, result, expires_after)
+        return result
+
+    async def refresh():
+        in_background_refresh.set(True)  # Only affects this task's context
+        try:
+            await _single_flight_async(cache_key, load)
+        except Exception as e:
+            print(f"Background refresh of {func.__name__} failed: {e}")
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(cache_key)
+
+    task = asyncio.ensure_future(refresh())
+    _async_refreshes.add(task)
+    task.add_done_callback(_async_refreshes.discard)
+
+def async_cache(ttl=300, stale_ttl=0, key=None):
+    """Coroutine counterpart of `cache`, sharing the same tiers and keys.
+
+    Entries written by a synchronous method are visible to an async method
+    of the same name and vice versa. Concurrent misses on one event loop are
+    coalesced into a single await of the wrapped coroutine.
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not Config.CACHE_ENABLED:
+                return await func(*args, **kwargs)
+
+            cache_key = _make_key(func, key, args, kwargs)
+
+            with metrics.span('cache_read', function=func.__name__):
+                entry = await _lookup_async(cache_key, ttl + stale_ttl)
+            if entry is not None:
+                timestamp, result = entry
+                age = time.time() - timestamp
+                if age < ttl:
+                    metrics.inc('cache_requests', function=func.__name__, result='hit')
+                    return result
+                if Config.CACHE_SERVE_STALE and age < ttl + stale_ttl:
+                    metrics.inc('cache_requests', function=func.__name__, result='stale')
+                    _refresh_in_background_async(cache_key, func, args, kwargs, ttl + stale_ttl)
+                    return result
+            metrics.inc('cache_requests', function=func.__name__, result='miss')
+
+            async def load():
+                entry = await _lookup_async(cache_key, ttl + stale_ttl)
+                if entry is not None and time.time() - entry[0] < ttl:
+                    return entry[1]
+
+                result = await func(*args, **kwargs)
+                if result is not None:
+                    await asyncio.to_thread(_store, cache_key, result, ttl + stale_ttl)
+                return result
+
+            return await _single_flight_async(cache_key, load)
+        return wrapper
+    return decorator
@@ -1,46 +1,530 @@
 import os
+import sys
 import json
 import time
+import sqlite3
 import hashlib
+import argparse
+import tempfile
+import threading
+import contextvars
+from collections import Counter, OrderedDict
 from functools import wraps
 from config import Config
+from utils.metrics import metrics
 
-def cache(ttl=300):
+class MemoryCache:
+    """Bounded in-process LRU cache sitting in front of the disk cache.
+
+    Entries are limited both by count and by their serialized size in bytes.
+    When a budget is exceeded, expired entries are dropped first and then the
+    least recently used ones. Cached results are shared, not copied, so
+    callers must not mutate them.
+    """
+
+    def __init__(self, max_entries, max_bytes):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (timestamp, expires, size, result)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return (timestamp, result) for a live entry, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            timestamp, expires, _, result = entry
+            if expires <= time.time():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return timestamp, result
+
+    def set(self, key, timestamp, expires, result, size):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                return  # Too big to keep; the old value for this key is gone either way
+            self._entries[key] = (timestamp, expires, size, result)
+            self._bytes += size
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _remove(self, key):
+        self._bytes -= self._entries.pop(key)[2]
+
+    def _evict(self):
+        if len(self._entries) <= self.max_entries and self._bytes <= self.max_bytes:
+            return
+
+        now = time.time()
+        for key in [k for k, entry in self._entries.items() if entry[1] <= now]:
+            self._remove(key)
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            key, (_, _, size, _) = self._entries.popitem(last=False)
+            self._bytes -= size
+            metrics.inc('cache_evictions', tier='memory', function=key.rsplit('_', 1)[0])
+
+class FileCacheBackend:
+    """Stores each entry as `{key}.json` in the cache directory"""
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self._dir_ready = False
+
+    def get(self, key):
+        """Return (timestamp, result, size) or None"""
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r') as f:
+            try:
+                raw = f.read()
+                data = json.loads(raw)
+                return data['timestamp'], data['result'], len(raw)
+            except (json.JSONDecodeError, KeyError):
+                return None  # Cache file corrupted, regenerate
+
+    def set(self, key, timestamp, expires, result):
+        """Store an entry and return its serialized size"""
+        if not self._dir_ready:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._dir_ready = True
+        raw = json.dumps({
+            'timestamp': timestamp,
+            'expires': expires,
+            'result': result
+        })
+        # Write to a temp file and rename it into place so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(raw)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        return len(raw)
+
+    def sweep(self):
+        """Delete expired entries, returning how many were removed"""
+        removed = 0
+        now = time.time()
+        for path in self._files():
+            try:
+                with open(path, 'r') as f:
+                    expires = json.load(f).get('expires', 0)
+            except (OSError, ValueError, AttributeError):
+                expires = 0
+            if expires < now:
+                try:
+                    os.remove(path)
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+    def stats(self):
+        files = self._files()
+        return {
+            'backend': 'file',
+            'location': self.cache_dir,
+            'entries': len(files),
+            'bytes': sum(os.path.getsize(path) for path in files)
+        }
+
+    def vacuum(self):
+        return self.sweep()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _files(self):
+        if not os.path.isdir(self.cache_dir):
+            return []
+        return [entry.path for entry in os.scandir(self.cache_dir)
+                if entry.name.endswith('.json')]
+
+class SQLiteCacheBackend:
+    """Stores all entries in a single indexed SQLite database.
+
+    The database runs in WAL mode with a busy timeout, so several processes
+    can share it. The total payload size is tracked by triggers; once it
+    exceeds `max_bytes`, expired entries are swept and then the least
+    recently accessed entries are evicted down to `EVICT_TARGET` of the cap.
+    """
+
+    EVICT_TARGET = 0.9
+    ACCESS_RESOLUTION = 60  # Only rewrite access times older than this
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS entries (
+            key TEXT PRIMARY KEY,
+            namespace TEXT NOT NULL,
+            timestamp REAL NOT NULL,
+            expires REAL NOT NULL,
+            accessed REAL NOT NULL,
+            size INTEGER NOT NULL,
+            value TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires);
+        CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+        CREATE TABLE IF NOT EXISTS totals (id INTEGER PRIMARY KEY CHECK (id = 0), bytes INTEGER NOT NULL);
+        INSERT OR IGNORE INTO totals (id, bytes) VALUES (0, 0);
+        CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN
+            UPDATE totals SET bytes = bytes + NEW.size WHERE id = 0;
+        END;
+        CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN
+            UPDATE totals SET bytes = bytes - OLD.size WHERE id = 0;
+        END;
+        CREATE TRIGGER IF NOT EXISTS entries_update AFTER UPDATE OF size ON entries BEGIN
+            UPDATE totals SET bytes = bytes - OLD.size + NEW.size WHERE id = 0;
+        END;
+    """
+
+    def __init__(self, path, max_bytes, sweep_interval):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+        self._next_sweep = 0
+
+    def get(self, key):
+        """Return (timestamp, result, size) or None"""
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT timestamp, accessed, size, value FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        timestamp, accessed, size, value = row
+        now = time.time()
+        if now - accessed > self.ACCESS_RESOLUTION:
+            conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+        try:
+            return timestamp, json.loads(value), size
+        except json.JSONDecodeError:
+            return None
+
+    def set(self, key, timestamp, expires, result):
+        """Store an entry and return its serialized size"""
+        value = json.dumps(result)
+        conn = self._connect()
+        conn.execute(
+            """INSERT INTO entries (key, namespace, timestamp, expires, accessed, size, value)
+               VALUES (?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT (key) DO UPDATE SET
+                   timestamp = excluded.timestamp, expires = excluded.expires,
+                   accessed = excluded.accessed, size = excluded.size, value = excluded.value""",
+            (key, key.rsplit('_', 1)[0], timestamp, expires, timestamp, len(value), value)
+        )
+        if timestamp >= self._next_sweep:
+            self._next_sweep = timestamp + self.sweep_interval
+            self.sweep()
+        if self._total_bytes(conn) > self.max_bytes:
+            self._evict(conn)
+        return len(value)
+
+    def sweep(self):
+        """Delete expired entries, returning how many were removed"""
+        cursor = self._connect().execute("DELETE FROM entries WHERE expires < ?", (time.time(),))
+        return cursor.rowcount
+
+    def stats(self):
+        conn = self._connect()
+        entries, expired = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(expires < ?), 0) FROM entries", (time.time(),)
+        ).fetchone()
+        namespaces = {
+            namespace: {'entries': count, 'bytes': size}
+            for namespace, count, size in conn.execute(
+                "SELECT namespace, COUNT(*), SUM(size) FROM entries GROUP BY namespace ORDER BY namespace"
+            )
+        }
+        file_bytes = sum(
+            os.path.getsize(path) for path in (self.path, self.path + '-wal')
+            if os.path.exists(path)
+        )
+        return {
+            'backend': 'sqlite',
+            'location': self.path,
+            'entries': entries,
+            'expired': expired,
+            'bytes': self._total_bytes(conn),
+            'max_bytes': self.max_bytes,
+            'file_bytes': file_bytes,
+            'namespaces': namespaces
+        }
+
+    def vacuum(self):
+        """Sweep expired entries and compact the database file"""
+        removed = self.sweep()
+        conn = self._connect()
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("VACUUM")
+        return removed
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # WAL mode and the schema persist in the file, so set them up once per
+            # backend rather than in every (short-lived) worker thread
+            with self._schema_lock:
+                if not self._schema_ready:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.executescript(self.SCHEMA)
+                    self._schema_ready = True
+            self._local.conn = conn
+        return conn
+
+    def _total_bytes(self, conn):
+        return conn.execute("SELECT bytes FROM totals WHERE id = 0").fetchone()[0]
+
+    def _evict(self, conn):
+        """Delete least recently accessed entries until the total is under EVICT_TARGET of the cap"""
+        self.sweep()
+        excess = self._total_bytes(conn) - self.max_bytes * self.EVICT_TARGET
+        if excess <= 0:
+            return
+
+        victims = []
+        cursor = conn.execute("SELECT key, namespace, size FROM entries ORDER BY accessed, key")
+        for key, namespace, size in cursor:
+            if excess <= 0:
+                break
+            victims.append((key, namespace))
+            excess -= size
+        cursor.close()
+
+        conn.execute("BEGIN")
+        try:
+            conn.executemany("DELETE FROM entries WHERE key = ?", ((key,) for key, _ in victims))
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+        for namespace, count in Counter(namespace for _, namespace in victims).items():
+            metrics.inc('cache_evictions', count, tier='disk', function=namespace)
+
+_backend = None
+_backend_lock = threading.Lock()
+
+def get_backend():
+    """Return the storage backend selected by Config.CACHE_BACKEND"""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                if Config.CACHE_BACKEND == 'sqlite':
+                    _backend = SQLiteCacheBackend(
+                        os.path.join(Config.CACHE_DIR, Config.CACHE_DB_FILE),
+                        Config.CACHE_MAX_BYTES,
+                        Config.CACHE_SWEEP_INTERVAL
+                    )
+                elif Config.CACHE_BACKEND == 'file':
+                    _backend = FileCacheBackend(Config.CACHE_DIR)
+                else:
+                    raise ValueError(f"Unknown cache backend: {Config.CACHE_BACKEND}")
+    return _backend
+
+def set_backend(backend):
+    """Install a custom backend implementing get/set/sweep/stats/vacuum"""
+    global _backend
+    _backend = backend
+
+memory_cache = MemoryCache(Config.CACHE_MEMORY_MAX_ENTRIES, Config.CACHE_MEMORY_MAX_BYTES)
+
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+class _Call:
+    """An in-flight computation that concurrent callers of the same key wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+def _single_flight(cache_key, fetch):
+    """Run `fetch` once for all concurrent callers of `cache_key`.
+
+    The first caller runs it; callers arriving while it is in flight block
+    and receive the same result (or exception).
+    """
+    with _inflight_lock:
+        call = _inflight.get(cache_key)
+        leader = call is None
+        if leader:
+            call = _inflight[cache_key] = _Call()
+
+    if not leader:
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    try:
+        call.result = fetch()
+        return call.result
+    except BaseException as e:
+        call.error = e
+        raise
+    finally:
+        with _inflight_lock:
+            del _inflight[cache_key]
+        call.done.set()
+
+def _lookup(cache_key, expires_after):
+    """Return (timestamp, result) from the memory tier or the backend, or None.
+
+    Backend hits younger than `expires_after` are promoted into the memory tier.
+    """
+    if Config.CACHE_MEMORY_ENABLED:
+        entry = memory_cache.get(cache_key)
+        if entry is not None:
+            return entry
+
+    entry = get_backend().get(cache_key)
+    if entry is None:
+        return None
+    timestamp, result, size = entry
+    if Config.CACHE_MEMORY_ENABLED and time.time() - timestamp < expires_after:
+        memory_cache.set(cache_key, timestamp, timestamp + expires_after, result, size)
+    return timestamp, result
+
+def _store(cache_key, result, expires_after):
+    timestamp = time.time()
+    expires = timestamp + expires_after
+    size = get_backend().set(cache_key, timestamp, expires, result)
+    if Config.CACHE_MEMORY_ENABLED:
+        memory_cache.set(cache_key, timestamp, expires, result, size)
+
+# True while recomputing a stale entry, so upstream requests can yield to interactive work
+in_background_refresh = contextvars.ContextVar('in_background_refresh', default=False)
+
+def _refresh_in_background(cache_key, func, args, kwargs, expires_after):
+    """Recompute a stale entry on a daemon thread, at most once per key at a time"""
+    with _refreshing_lock:
+        if cache_key in _refreshing:
+            return
+        _refreshing.add(cache_key)
+
+    def load():
+        result = func(*args, **kwargs)
+        if result is not None:
+            _store(cache_key, result, expires_after)
+        return result
+
+    def refresh():
+        in_background_refresh.set(True)
+        try:
+            _single_flight(cache_key, load)
+        except Exception as e:
+            print(f"Background refresh of {func.__name__} failed: {e}")
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(cache_key)
+
+    threading.Thread(target=refresh, name=f"refresh-{func.__name__}", daemon=True).start()
+
+def _make_key(func, key, args, kwargs):
+    # Generate safe cache key using hash
+    if key is None:
+        args_key = str(args[1:]) + str(kwargs)  # Skip self/cls parameter
+    else:
+        args_key = key(*args[1:], **kwargs)
+    return f"{func.__name__}_{hashlib.md5(args_key.encode()).hexdigest()}"
+
+def cache(ttl=300, stale_ttl=0, key=None):
+    """Cache a method's JSON-serializable results for `ttl` seconds.
+
+    The cache key is built from the arguments after self; pass `key` to
+    derive it differently, e.g. `utils.geo.geohash_key` for coordinates.
+
+    With `stale_ttl` and Config.CACHE_SERVE_STALE, an entry up to `stale_ttl`
+    seconds past its TTL is still returned immediately while a background
+    refresh replaces it. Otherwise (one-shot runs, whose daemon refresh
+    threads would die at exit) and for entries older than `ttl + stale_ttl`,
+    expired entries are refetched synchronously.
+    """
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
             if not Config.CACHE_ENABLED:
                 return func(*args, **kwargs)
-                
-            # Create cache dir if not exists
-            os.makedirs(Config.CACHE_DIR, exist_ok=True)
-            
-            # Generate safe cache key using hash
-            args_key = str(args[1:]) + str(kwargs)  # Skip self/cls parameter
-            cache_key = hashlib.md5(args_key.encode()).hexdigest()
-            cache_file = os.path.join(Config.CACHE_DIR, f"{func.__name__}_{cache_key}.json")
-            
-            # Check cache
-            if os.path.exists(cache_file):
-                with open(cache_file, 'r') as f:
-                    try:
-                        data = json.load(f)
-                        if time.time() - data['timestamp'] < ttl:
-                            return data['result']
-                    except (json.JSONDecodeError, KeyError):
-                        pass  # Cache file corrupted, regenerate
-            
-            # Call function if cache miss
-            result = func(*args, **kwargs)
-            
-            # Save to cache
-            if result is not None:
-                with open(cache_file, 'w') as f:
-                    json.dump({
-                        'timestamp': time.time(),
-                        'result': result
-                    }, f)
-            
-            return result
+
+            cache_key = _make_key(func, key, args, kwargs)
+
+            # Check the in-memory tier first, then the persistent backend
+            with metrics.span('cache_read', function=func.__name__):
+                entry = _lookup(cache_key, ttl + stale_ttl)
+            if entry is not None:
+                timestamp, result = entry
+                age = time.time() - timestamp
+                if age < ttl:
+                    metrics.inc('cache_requests', function=func.__name__, result='hit')
+                    return result
+                if Config.CACHE_SERVE_STALE and age < ttl + stale_ttl:
+                    metrics.inc('cache_requests', function=func.__name__, result='stale')
+                    _refresh_in_background(cache_key, func, args, kwargs, ttl + stale_ttl)
+                    return result
+            metrics.inc('cache_requests', function=func.__name__, result='miss')
+
+            def load():
+                # Another caller may have filled the entry while we waited to lead
+                entry = _lookup(cache_key, ttl + stale_ttl)
+                if entry is not None and time.time() - entry[0] < ttl:
+                    return entry[1]
+
+                result = func(*args, **kwargs)
+                if result is not None:
+                    _store(cache_key, result, ttl + stale_ttl)
+                return result
+
+            # Cache miss: coalesce concurrent callers into a single upstream call
+            return _single_flight(cache_key, load)
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect and maintain the response cache")
+    parser.add_argument("command", choices=["stats", "sweep", "vacuum"],
+                        help="stats: report usage, sweep: drop expired entries, vacuum: sweep and compact")
+    args = parser.parse_args(argv)
+
+    backend = get_backend()
+    if args.command == "stats":
+        print(json.dumps(backend.stats(), indent=2))
+    elif args.command == "sweep":
+        print(f"Removed {backend.sweep()} expired entries")
+    else:
+        print(f"Removed {backend.vacuum()} expired entries")
+        print(json.dumps(backend.stats(), indent=2))
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+import time
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from config import Config
+from utils.metrics import metrics
+
+class Deadline:
+    """A task's timeout clock, stopped while the task waits for a rate limit token.
+
+    Time spent queued in api_clients.scheduler doesn't count against the
+    provider timeout, so a busy rate limit delays a fetch instead of failing
+    it. The clock stops while any of the task's requests (e.g. concurrent
+    attraction details) is queued.
+    """
+
+    POLL_INTERVAL = 0.1  # How often a stopped clock is re-checked
+
+    def __init__(self, timeout):
+        self._lock = threading.Lock()
+        self._expires = time.monotonic() + timeout
+        self._waiting = 0
+        self._stopped_at = None
+
+    def pause(self):
+        with self._lock:
+            self._waiting += 1
+            if self._waiting == 1:
+                self._stopped_at = time.monotonic()
+
+    def resume(self):
+        with self._lock:
+            self._waiting -= 1
+            if self._waiting == 0:
+                self._expires += time.monotonic() - self._stopped_at
+                self._stopped_at = None
+
+    def remaining(self):
+        """Seconds until expiry, or POLL_INTERVAL while the clock is stopped"""
+        with self._lock:
+            if self._stopped_at is not None:
+                return self.POLL_INTERVAL
+            return self._expires - time.monotonic()
+
+    def expired(self):
+        return self.remaining() <= 0
+
+# Deadline of the fetch_all task running in this thread/task, if any
+current_deadline = contextvars.ContextVar('current_deadline', default=None)
+
+def fetch_all(tasks, timeouts=None, max_workers=None, on_result=None):
+    """Run independent fetches concurrently and collect their results.
+
+    `tasks` maps a name to a `(callable, fallback)` pair. Every callable is
+    started on a bounded worker pool; each one gets its own timeout from
+    `timeouts` (falling back to Config.PROVIDER_TIMEOUT). A task that raises
+    or runs past its timeout contributes its fallback value instead. Time
+    spent waiting for a provider rate limit is not counted (see `Deadline`).
+
+    If given, `on_result(name, value)` is called from the calling thread as
+    soon as each task's value (or fallback) is known.
+    """
+    timeouts = timeouts or {}
+    max_workers = max_workers or Config.FETCH_MAX_WORKERS
+    results = {}
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(max_workers, len(tasks)) or 1,
+        thread_name_prefix="fetch"
+    )
+    try:
+        pending = {}
+        for name, (func, fallback) in tasks.items():
+            deadline = Deadline(timeouts.get(name, Config.PROVIDER_TIMEOUT))
+            pending[executor.submit(_timed, name, func, deadline)] = (name, fallback, deadline)
+
+        while pending:
+            done, _ = wait(
+                pending,
+                timeout=max(0, min(deadline.remaining() for _, _, deadline in pending.values())),
+                return_when=FIRST_COMPLETED
+            )
+
+            for future in done:
+                name, fallback, _ = pending.pop(future)
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    print(f"{name.capitalize()} fetch error: {e}")
+                    metrics.inc('provider_failures', provider=name, kind='error')
+                    results[name] = fallback
+                if on_result:
+                    on_result(name, results[name])
+
+            for future, (name, fallback, deadline) in list(pending.items()):
+                if deadline.expired():
+                    del pending[future]
+                    future.cancel()
+                    print(f"{name.capitalize()} fetch timed out")
+                    metrics.inc('provider_failures', provider=name, kind='timeout')
+                    results[name] = fallback
+                    if on_result:
+                        on_result(name, fallback)
+    finally:
+        # Don't block on providers that timed out; their threads finish in the background
+        executor.shutdown(wait=False)
+
+    return {name: results[name] for name in tasks}
+
+def _timed(name, func, deadline=None):
+    token = current_deadline.set(deadline)
+    try:
+        with metrics.span('fetch', provider=name):
+            return func()
+    finally:
+        current_deadline.reset(token)
+
+async def fetch_all_async(tasks, timeouts=None):
+    """Coroutine counterpart of `fetch_all` running every fetch on the current loop.
+
+    `tasks` maps a name to a `(coroutine_function, fallback)` pair.
+    """
+    import asyncio  # Deferred so synchronous runs don't pay for importing asyncio
+
+    timeouts = timeouts or {}
+
+    async def run(name, func, fallback):
+        deadline = Deadline(timeouts.get(name, Config.PROVIDER_TIMEOUT))
+        current_deadline.set(deadline)  # Each gathered coroutine runs in its own task context
+        task = asyncio.ensure_future(func())
+        try:
+            with metrics.span('fetch', provider=name):
+                while not task.done():
+                    await asyncio.wait({task}, timeout=max(0, deadline.remaining()))
+                    if not task.done() and deadline.expired():
+                        task.cancel()
+                        raise asyncio.TimeoutError()
+                return task.result()
+        except asyncio.TimeoutError:
+            print(f"{name.capitalize()} fetch timed out")
+            metrics.inc('provider_failures', provider=name, kind='timeout')
+        except Exception as e:
+            print(f"{name.capitalize()} fetch error: {e}")
+            metrics.inc('provider_failures', provider=name, kind='error')
+        return fallback
+
+    results = await asyncio.gather(*(
+        run(name, func, fallback) for name, (func, fallback) in tasks.items()
+    ))
+    return dict(zip(tasks, results))
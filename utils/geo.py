@@ -0,0 +1,41 @@
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+def geohash(lat, lon, precision=7):
+    """Encode a coordinate as a geohash string of `precision` characters.
+
+    Approximate cell sizes: 4 = 39 km, 5 = 4.9 km, 6 = 1.2 km, 7 = 153 m.
+    """
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+
+    while len(chars) < precision:
+        value, bounds = (lon, lon_range) if even else (lat, lat_range)
+        mid = (bounds[0] + bounds[1]) / 2
+        bits <<= 1
+        if value >= mid:
+            bits |= 1
+            bounds[0] = mid
+        else:
+            bounds[1] = mid
+        even = not even
+
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+
+    return ''.join(chars)
+
+def geohash_key(precision):
+    """Build a @cache key function that snaps the leading (lat, lon) arguments to a geohash cell.
+
+    Calls whose coordinates fall in the same cell share one cache entry.
+    """
+    def key(lat, lon, *args, **kwargs):
+        return f"geohash:{geohash(lat, lon, precision)}" + str(args) + str(kwargs)
+    return key
@@ -0,0 +1,139 @@
+import json
+import time
+import threading
+from contextlib import contextmanager
+from config import Config
+
+class Metrics:
+    """Process-wide counters and timing spans, exportable as JSON or Prometheus text.
+
+    Series are identified by a metric name plus keyword labels, e.g.
+    `metrics.inc('cache_requests', function='get_weather', result='hit')`.
+    Every recording call returns immediately while `enabled` is False, so
+    instrumented code paths cost one attribute check when metrics are off.
+    Spans also drive `profiler` (see utils.profiling) when one is installed.
+    """
+
+    PREFIX = "explorer_"
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.profiler = None
+        self._lock = threading.Lock()
+        self._counters = {}  # (name, labels) -> count
+        self._timings = {}  # (name, labels) -> [count, total seconds, max seconds]
+
+    def inc(self, name, amount=1, **labels):
+        if not self.enabled:
+            return
+        series = _series(name, labels)
+        with self._lock:
+            self._counters[series] = self._counters.get(series, 0) + amount
+
+    def observe(self, name, seconds, **labels):
+        if not self.enabled:
+            return
+        series = _series(name, labels)
+        with self._lock:
+            timing = self._timings.get(series)
+            if timing is None:
+                self._timings[series] = [1, seconds, seconds]
+            else:
+                timing[0] += 1
+                timing[1] += seconds
+                timing[2] = max(timing[2], seconds)
+
+    def span(self, stage, **labels):
+        """Context manager timing a block as `stage_seconds{stage=..., **labels}`"""
+        if self.profiler is not None and stage in self.profiler.STAGES:
+            return self._profiled_span(stage, labels)
+        if not self.enabled:
+            return _NO_SPAN
+        return self._span(stage, labels)
+
+    @contextmanager
+    def _profiled_span(self, stage, labels):
+        with self.profiler.stage(self.profiler.stage_name(stage, labels)):
+            with self._span(stage, labels) if self.enabled else _NO_SPAN:
+                yield
+
+    @contextmanager
+    def _span(self, stage, labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe('stage_seconds', time.perf_counter() - start, stage=stage, **labels)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._timings.clear()
+
+    def snapshot(self):
+        """Return all series as a JSON-serializable dict"""
+        with self._lock:
+            counters = [
+                {'name': name, 'labels': dict(labels), 'value': value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+            timings = [
+                {'name': name, 'labels': dict(labels), 'count': count,
+                 'sum_seconds': round(total, 6), 'max_seconds': round(peak, 6)}
+                for (name, labels), (count, total, peak) in sorted(self._timings.items())
+            ]
+        return {'counters': counters, 'timings': timings}
+
+    def to_prometheus(self):
+        """Return all series in the Prometheus text exposition format"""
+        snapshot = self.snapshot()
+        lines = []
+        typed = set()
+
+        def declare(metric, kind):
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f"# TYPE {metric} {kind}")
+
+        for series in snapshot['counters']:
+            metric = f"{self.PREFIX}{series['name']}_total"
+            declare(metric, "counter")
+            lines.append(f"{metric}{_labels(series['labels'])} {series['value']}")
+        for series in snapshot['timings']:
+            metric = f"{self.PREFIX}{series['name']}"
+            declare(metric, "summary")
+            labels = _labels(series['labels'])
+            lines.append(f"{metric}_count{labels} {series['count']}")
+            lines.append(f"{metric}_sum{labels} {series['sum_seconds']}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        """Write Prometheus text for *.prom / *.txt paths, a JSON snapshot otherwise"""
+        if path.endswith(('.prom', '.txt')):
+            content = self.to_prometheus()
+        else:
+            content = json.dumps(self.snapshot(), indent=2)
+        with open(path, 'w') as f:
+            f.write(content)
+
+def _series(name, labels):
+    return name, tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+class _NoSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+_NO_SPAN = _NoSpan()
+
+metrics = Metrics(enabled=Config.METRICS_ENABLED)
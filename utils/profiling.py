@@ -0,0 +1,124 @@
+import os
+import io
+import pstats
+import cProfile
+import threading
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from config import Config
+from utils.metrics import metrics
+from utils.fanout import current_deadline
+
+class StageProfiler:
+    """CPU and allocation profiles per pipeline stage, aggregated over every run.
+
+    Installed on `utils.metrics.metrics`, it profiles the top-level spans
+    listed in STAGES (named e.g. 'fetch.weather' or 'render.events' after
+    their labels). Each run gets its own cProfile.Profile in the thread that
+    enters the stage, merged into the stage's totals when it exits, so
+    provider fetches and batch workers keep running concurrently and keep
+    their timeouts. Attraction detail lookups run inline in the attractions
+    fetch while profiling, since cProfile can't see other threads.
+
+    Allocations are diffs of process-wide tracemalloc snapshots, so stages
+    that overlap in time (concurrent fetches, batch workers) include some of
+    each other's allocations; run batches with --concurrency 1 for clean
+    per-stage figures.
+    """
+
+    STAGES = ('geocode', 'fetch', 'analyze', 'match', 'render')
+
+    def __init__(self, out_dir, top_n=None):
+        self.out_dir = out_dir
+        self.top_n = top_n or Config.PROFILE_TOP_N
+        self._lock = threading.Lock()
+        self._stats = {}  # stage -> pstats.Stats merged over every run
+        self._calls = Counter()
+        self._allocated = {}  # stage -> Counter of "file:line" -> net bytes
+
+    def stage_name(self, stage, labels):
+        return '.'.join([stage, *(str(value) for value in labels.values())])
+
+    @contextmanager
+    def stage(self, name):
+        profile = cProfile.Profile()
+        with self._overhead():
+            before = self._snapshot()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            with self._overhead():
+                diffs = self._snapshot().compare_to(before, 'lineno')
+                stats = pstats.Stats(profile)
+                with self._lock:
+                    if name in self._stats:
+                        self._stats[name].add(stats)
+                    else:
+                        self._stats[name] = stats
+                    allocated = self._allocated.setdefault(name, Counter())
+                    for diff in diffs:
+                        frame = diff.traceback[0]
+                        allocated[f"{frame.filename}:{frame.lineno}"] += diff.size_diff
+                    self._calls[name] += 1
+
+    @contextmanager
+    def _overhead(self):
+        # Snapshots take a while; don't count them against the running fetch's timeout
+        deadline = current_deadline.get()
+        if deadline:
+            deadline.pause()
+        try:
+            yield
+        finally:
+            if deadline:
+                deadline.resume()
+
+    def _snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+
+    def write(self):
+        """Write <stage>.pstats per stage plus allocations.txt; return a printable summary"""
+        os.makedirs(self.out_dir, exist_ok=True)
+        summary = io.StringIO()
+        allocations = io.StringIO()
+
+        with self._lock:
+            for name in sorted(self._stats):
+                stats = self._stats[name]
+                stats.dump_stats(os.path.join(self.out_dir, f"{name}.pstats"))
+                net = sum(self._allocated[name].values())
+                summary.write(f"{name:28} {self._calls[name]:5} runs  "
+                              f"{stats.total_tt:8.3f} s profiled  "
+                              f"net {net / 1024:+.0f} KiB\n")
+
+                allocations.write(f"== {name} ({self._calls[name]} runs, "
+                                  f"net {net / 1024:+.1f} KiB)\n")
+                top = self._allocated[name].most_common(self.top_n)
+                for location, size in top:
+                    if size > 0:
+                        allocations.write(f"{size / 1024:10.1f} KiB  {location}\n")
+                allocations.write("\n")
+
+        with open(os.path.join(self.out_dir, "allocations.txt"), 'w') as f:
+            f.write(allocations.getvalue())
+        return summary.getvalue()
+
+def start(out_dir, top_n=None):
+    """Begin profiling pipeline stages into `out_dir`"""
+    tracemalloc.start()
+    metrics.profiler = StageProfiler(out_dir, top_n)
+    return metrics.profiler
+
+def stop():
+    """Stop profiling, write the reports and return the summary"""
+    profiler, metrics.profiler = metrics.profiler, None
+    try:
+        return profiler.write() if profiler else ""
+    finally:
+        tracemalloc.stop()
@@ -0,0 +1,177 @@
+import os
+import sys
+import json
+import time
+import random
+import hashlib
+import argparse
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qsl
+from config import Config
+
+# Credentials are dropped from recorded fixtures and ignored when matching requests
+SECRET_PARAMS = {'apikey', 'appid', 'key'}
+
+def _clean_params(params):
+    return sorted((str(k), str(v)) for k, v in (params or {}).items() if k not in SECRET_PARAMS)
+
+def fixture_key(path, params):
+    """Stable fixture name for a provider request path and its non-secret query parameters"""
+    raw = json.dumps([path, _clean_params(params)])
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+def record(provider, url, params, status, text, fixture_dir=None):
+    """Save one provider response as <fixture_dir>/<provider>/<key>.json"""
+    fixture_dir = fixture_dir or Config.RECORD_DIR
+    try:
+        body = json.loads(text)
+    except ValueError:
+        body = text
+    path = urlsplit(url).path
+    directory = os.path.join(fixture_dir, provider)
+    os.makedirs(directory, exist_ok=True)
+
+    fixture = {
+        'provider': provider,
+        'path': path,
+        'params': dict(_clean_params(params)),
+        'status': status,
+        'body': body
+    }
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(fixture, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, os.path.join(directory, fixture_key(path, params) + '.json'))
+
+class FixtureStore:
+    """Recorded responses indexed by provider, path and query parameters.
+
+    A request with no exact match falls back to any fixture for the same
+    provider and path, so e.g. synthetic fixtures can answer every coordinate.
+    """
+
+    def __init__(self, fixture_dir):
+        self.exact = {}
+        self.by_path = {}
+        for provider in sorted(os.listdir(fixture_dir)):
+            directory = os.path.join(fixture_dir, provider)
+            if not os.path.isdir(directory):
+                continue
+            for name in sorted(os.listdir(directory)):
+                if not name.endswith('.json'):
+                    continue
+                with open(os.path.join(directory, name), encoding='utf-8') as f:
+                    fixture = json.load(f)
+                self.exact[(provider, fixture_key(fixture['path'], fixture['params']))] = fixture
+                self.by_path.setdefault((provider, fixture['path']), fixture)
+
+    def __len__(self):
+        return len(self.exact)
+
+    def find(self, provider, path, params):
+        return (self.exact.get((provider, fixture_key(path, params)))
+                or self.by_path.get((provider, path)))
+
+class ReplayRequestHandler(BaseHTTPRequestHandler):
+    """Answers GET /<provider>/<original path>?<query> from recorded fixtures"""
+
+    server_version = "ProviderReplay/1.0"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        provider, _, path = url.path.lstrip('/').partition('/')
+        params = dict(parse_qsl(url.query))
+        server = self.server
+
+        delay = server.latency + random.uniform(-server.jitter, server.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+        if random.random() < server.error_rate:
+            return self._send_json(server.error_status, {'error': "Injected failure"})
+
+        fixture = server.fixtures.find(provider, '/' + path, params)
+        if fixture is None:
+            return self._send_json(404, {'error': f"No fixture for {provider} /{path}"})
+        self._send_json(fixture['status'], fixture['body'])
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+class ReplayServer(ThreadingHTTPServer):
+    """Local stand-in for every provider, with injected latency, jitter and errors.
+
+    Point the clients at it with PROVIDER_URL_OVERRIDE=http://<host>:<port>.
+    Latency and jitter are in seconds; `error_rate` is the fraction of requests
+    answered with `error_status` instead of the fixture.
+    """
+
+    daemon_threads = True
+    request_queue_size = 128  # Concurrent benchmarks connect in bursts
+
+    def __init__(self, address, fixtures, latency=0.0, jitter=0.0,
+                 error_rate=0.0, error_status=503, verbose=False):
+        super().__init__(address, ReplayRequestHandler)
+        self.fixtures = fixtures
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.verbose = verbose
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+def start_server(fixture_dir, host='127.0.0.1', port=0, **options):
+    """Start a ReplayServer on a daemon thread and return it (port 0 picks a free one)"""
+    server = ReplayServer((host, port), FixtureStore(fixture_dir), **options)
+    threading.Thread(target=server.serve_forever, name="replay", daemon=True).start()
+    return server
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Serve recorded provider responses (record them with RECORD_DIR=<dir>)"
+    )
+    parser.add_argument("fixtures", help="Fixture directory written by record mode")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Delay added to every response")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Random +/- variation of the delay")
+    parser.add_argument("--error-rate", type=float, default=0, help="Fraction of requests that fail (0-1)")
+    parser.add_argument("--error-status", type=int, default=503, help="HTTP status for injected failures")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args(argv)
+
+    server = ReplayServer(
+        (args.host, args.port),
+        FixtureStore(args.fixtures),
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        verbose=args.verbose
+    )
+    print(f"Replaying {len(server.fixtures)} fixtures on {server.url}")
+    print(f"Run clients with PROVIDER_URL_OVERRIDE={server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    sys.exit(main())